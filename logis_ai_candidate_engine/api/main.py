@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from fastapi import Depends, FastAPI, Header, HTTPException
@@ -26,6 +29,7 @@ from logis_ai_candidate_engine.core.schemas.evaluation_response import (
 from logis_ai_candidate_engine.core.schemas.job import Job
 from logis_ai_candidate_engine.core.scoring.experience_scorer import ExperienceScorer
 from logis_ai_candidate_engine.core.scoring.skills_scorer import SkillsScorer
+from logis_ai_candidate_engine.ml.embedding_model import EmbeddingModel
 from logis_ai_candidate_engine.ml.semantic_similarity import SemanticSimilarityScorer
 
 # Import CV parsing routes (Phase 3)
@@ -74,12 +78,39 @@ def _decision_from_score(total_score: int) -> str:
     return "NOT_RECOMMENDED"
 
 
+@lru_cache(maxsize=1)
+def _get_skills_scorer() -> SkillsScorer:
+    """Build the skills scorer (taxonomy + lookup maps) once per process."""
+    return SkillsScorer(embedding_model=EmbeddingModel)
+
+
+def _preload_embedding_model() -> None:
+    try:
+        EmbeddingModel.load()
+    except Exception:
+        # Encoding falls back to the hashing encoder when the model is unavailable
+        pass
+    _get_skills_scorer()
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Load the embedding model in the background so startup is not blocked but
+    # the first request usually finds it ready; EMBEDDING_PRELOAD=0 disables it
+    if os.getenv("EMBEDDING_PRELOAD", "1") != "0":
+        threading.Thread(
+            target=_preload_embedding_model, name="embedding-preload", daemon=True
+        ).start()
+    yield
+
+
 app = FastAPI(
     title="Logis AI Candidate Engine",
     version="2.0.0",
     description="Enterprise-grade AI-powered candidate ranking system for Logis Career. "
                 "Features: Advanced hybrid scoring, confidence metrics, contextual adjustments, "
                 "and feature interaction detection. Built to Senior SDE/ML Engineer standards.",
+    lifespan=_lifespan,
 )
 
 # Include CV parsing routes (Phase 3: NER CV Parsing)
@@ -144,12 +175,8 @@ def evaluate(payload: EvaluationRequest, _: None = Depends(_require_api_key)) ->
     # Step 2: Soft Scoring (Multi-Signal Evaluation with Advanced Skill Matching)
     # =========================================================================
     
-    # Initialize scorers (SkillsScorer now takes embedding model)
-    semantic_scorer = SemanticSimilarityScorer()
-    skills_scorer = SkillsScorer(embedding_model=semantic_scorer.model)
-    
     # Score skills with advanced matching (required + preferred)
-    skills = skills_scorer.score(
+    skills = _get_skills_scorer().score(
         required_skills=job.required_skills,
         candidate_skills=candidate.skills,
         preferred_skills=getattr(job, 'preferred_skills', [])  # Use new field if available
@@ -164,7 +191,7 @@ def evaluate(payload: EvaluationRequest, _: None = Depends(_require_api_key)) ->
 
     # Score semantic similarity
     job_text, candidate_text, job_profile_text = _build_semantic_inputs(job, candidate)
-    semantic = semantic_scorer.score(job_text, candidate_text, job_profile_text)
+    semantic = SemanticSimilarityScorer.score(job_text, candidate_text, job_profile_text)
 
     # Build raw section scores for aggregation
     raw_section_scores: Dict[str, int] = {
@@ -3,6 +3,7 @@
 #
 # Provides REST API endpoints for CV parsing operations:
 # - Parse CV text and return structured data
+# - Parse a batch of CV texts in one request
 # - Parse CV and auto-create a Candidate object
 # - Parse CV and directly evaluate against a job
 
@@ -71,6 +72,18 @@ class ParsedCVResponse(BaseModel):
     parsed_at: str = Field(..., description="Timestamp of parsing")
 
 
+class ParseCVBatchRequest(BaseModel):
+    """Request model for batch CV parsing"""
+    cv_texts: List[str] = Field(..., description="Raw CV texts to parse", min_length=1)
+
+
+class ParseCVBatchResponse(BaseModel):
+    """Response model for batch CV parsing"""
+    success: bool
+    results: List[ParsedCVResponse] = Field(default_factory=list, description="Parsed CVs in request order")
+    total_parsed: int
+
+
 class CVToCandidateRequest(BaseModel):
     """Request to parse CV and create a Candidate object"""
     cv_text: str = Field(..., description="Raw CV text to parse", min_length=50)
@@ -152,6 +165,26 @@ def get_mapper() -> CVToCandidateMapper:
     return _mapper
 
 
+def _to_parsed_cv_response(result: ParsedCV, parsed_at: str) -> ParsedCVResponse:
+    """Build the API response for one parsed CV"""
+    return ParsedCVResponse(
+        success=True,
+        name=result.name,
+        email=result.contact.email,
+        phone=result.contact.phone,
+        linkedin_url=result.contact.linkedin_url,
+        summary=result.summary,
+        skills=[s.to_dict() for s in result.skills],
+        experience=[e.to_dict() for e in result.experience],
+        education=[e.to_dict() for e in result.education],
+        total_experience_years=result.total_experience_years,
+        languages=result.languages,
+        extraction_confidence=result.extraction_confidence,
+        parsing_warnings=result.parsing_warnings,
+        parsed_at=parsed_at,
+    )
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
@@ -178,27 +211,39 @@ def parse_cv(request: ParseCVRequest) -> ParsedCVResponse:
         parser = get_parser()
         result = parser.parse(request.cv_text)
         
-        return ParsedCVResponse(
+        return _to_parsed_cv_response(result, datetime.now().isoformat())
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"CV parsing failed: {str(e)}"
+        )
+
+
+@router.post("/parse-batch", response_model=ParseCVBatchResponse)
+def parse_cv_batch(request: ParseCVBatchRequest) -> ParseCVBatchResponse:
+    """
+    Parse a batch of raw CV texts in one request.
+    
+    All CVs share the singleton parser (taxonomy and section keyword
+    index are built once) and are parsed concurrently on a thread pool.
+    Results are returned in request order.
+    """
+    try:
+        parser = get_parser()
+        results = parser.parse_many(request.cv_texts)
+        parsed_at = datetime.now().isoformat()
+        
+        return ParseCVBatchResponse(
             success=True,
-            name=result.name,
-            email=result.contact.email,
-            phone=result.contact.phone,
-            linkedin_url=result.contact.linkedin_url,
-            summary=result.summary,
-            skills=[s.to_dict() for s in result.skills],
-            experience=[e.to_dict() for e in result.experience],
-            education=[e.to_dict() for e in result.education],
-            total_experience_years=result.total_experience_years,
-            languages=result.languages,
-            extraction_confidence=result.extraction_confidence,
-            parsing_warnings=result.parsing_warnings,
-            parsed_at=datetime.now().isoformat(),
+            results=[_to_parsed_cv_response(result, parsed_at) for result in results],
+            total_parsed=len(results),
         )
     
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"CV parsing failed: {str(e)}"
+            detail=f"Batch CV parsing failed: {str(e)}"
         )
 
 
@@ -6,6 +6,7 @@
 
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
 
 from logis_ai_candidate_engine.core.schemas.candidate import Candidate
 from logis_ai_candidate_engine.core.schemas.job import Job
@@ -252,7 +253,12 @@ class SmartWeightOptimizer:
         """
         
         title_lower = job.job_title.lower() if job.job_title else ""
-        
+        return self._classify_job_level(title_lower, job.min_experience_years)
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _classify_job_level(title_lower: str, min_experience_years: Optional[float]) -> JobLevel:
+        """Level for a (title, min experience) signature; jobs repeat, so results are memoized"""
         # Check for executive keywords
         executive_keywords = ['director', 'vp', 'vice president', 'chief', 'ceo', 'coo', 'cfo', 'head of']
         if any(kw in title_lower for kw in executive_keywords):
@@ -269,14 +275,14 @@ class SmartWeightOptimizer:
             return JobLevel.ENTRY
         
         # Use experience requirements as fallback
-        if job.min_experience_years is not None:
-            if job.min_experience_years >= 10:
+        if min_experience_years is not None:
+            if min_experience_years >= 10:
                 return JobLevel.EXECUTIVE
-            elif job.min_experience_years >= 5:
+            elif min_experience_years >= 5:
                 return JobLevel.SENIOR
-            elif job.min_experience_years >= 2:
+            elif min_experience_years >= 2:
                 return JobLevel.MID
-            elif job.min_experience_years < 2:
+            elif min_experience_years < 2:
                 return JobLevel.ENTRY
         
         # Default to unknown
@@ -291,17 +297,24 @@ class SmartWeightOptimizer:
         """
         
         job_level = self.determine_job_level(job)
-        weights = self.WEIGHT_PROFILES[job_level].copy()
-        
-        # Normalize weights to sum to 1.0
-        total = sum(weights.values())
-        if total > 0:
-            weights = {k: v / total for k, v in weights.items()}
+        # Fresh dict per call so callers can adjust it in place
+        weights = dict(self._normalized_profile(job_level))
         
         profile_name = job_level.value
         
         return weights, profile_name
     
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _normalized_profile(cls, job_level: JobLevel) -> Tuple[Tuple[str, float], ...]:
+        """Weight profile for a level, normalized to sum to 1.0 (computed once per level)"""
+        weights = cls.WEIGHT_PROFILES[job_level]
+        
+        total = sum(weights.values())
+        if total > 0:
+            return tuple((k, v / total) for k, v in weights.items())
+        return tuple(weights.items())
+    
     def adjust_for_job_specifics(
         self, 
         base_weights: Dict[str, float],
@@ -7,6 +7,7 @@
 
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
+import numpy as np
 import yaml
 from pathlib import Path
 
@@ -15,6 +16,20 @@ from logis_ai_candidate_engine.core.schemas.job import Job
 from logis_ai_candidate_engine.core.schemas.evaluation_response import ContextualAdjustment
 
 
+# Final scores live on a 0-100 scale
+MIN_SCORE = 0
+MAX_SCORE = 100
+
+
+def clip_scores(base_scores, deltas) -> np.ndarray:
+    """Clamp base + delta into [MIN_SCORE, MAX_SCORE] elementwise, without branching"""
+    return np.clip(
+        np.asarray(base_scores, dtype=np.float64) + np.asarray(deltas, dtype=np.float64),
+        MIN_SCORE,
+        MAX_SCORE,
+    )
+
+
 @dataclass
 class AdjustmentRule:
     """Defines a contextual adjustment rule"""
@@ -45,6 +60,9 @@ class ContextualAdjuster:
     - Deterministic and reproducible
     """
     
+    # Job title keywords that indicate career progression
+    PROGRESSION_KEYWORDS = ('senior', 'lead', 'principal', 'director', 'manager', 'head')
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the contextual adjuster.
@@ -53,6 +71,8 @@ class ContextualAdjuster:
             config_path: Optional path to adjustment rules YAML file
         """
         self.rules = self._load_rules(config_path)
+        # Rules are fixed after loading, so evaluation order is computed once
+        self._rules_by_priority = sorted(self.rules, key=lambda r: r.priority, reverse=True)
     
     def _load_rules(self, config_path: Optional[str]) -> List[AdjustmentRule]:
         """Load adjustment rules from config or use defaults"""
@@ -243,24 +263,87 @@ class ContextualAdjuster:
         Returns:
             (adjusted_score, list_of_adjustments_applied)
         """
-        adjustments_applied = []
-        total_adjustment = 0.0
-        
         # Extract features for rule evaluation
         features = self._extract_features(job, candidate, section_scores)
         
+        return self._apply_rules(base_score, features)
+    
+    def apply_adjustments_batch(
+        self,
+        base_scores: List[float],
+        job: Job,
+        candidates: List[Candidate],
+        section_scores: List[Dict[str, int]],
+    ) -> List[tuple[float, List[ContextualAdjustment]]]:
+        """
+        Apply contextual adjustments for many candidates against one job.
+        
+        Job-derived features (required skill set, salary range) are computed
+        once for the whole batch instead of once per candidate.
+        
+        Returns:
+            One (adjusted_score, list_of_adjustments_applied) per candidate,
+            in input order
+        
+        Raises:
+            ValueError: If the three per-candidate lists differ in length
+        """
+        if not len(base_scores) == len(candidates) == len(section_scores):
+            raise ValueError(
+                "base_scores, candidates and section_scores must have the same length"
+            )
+        
+        job_features = self._extract_job_features(job)
+        
+        rows = list(zip(base_scores, candidates, section_scores))
+        evaluated = [
+            self._evaluate_rules(self._extract_features(job, candidate, scores, job_features))
+            for _, candidate, scores in rows
+        ]
+        
+        # Clamp the whole batch in one vectorized pass
+        adjusted_scores = clip_scores(
+            [base_score for base_score, _, _ in rows],
+            [total for total, _ in evaluated],
+        ).tolist()
+        
+        return [
+            (adjusted_score, adjustments)
+            for adjusted_score, (_, adjustments) in zip(adjusted_scores, evaluated)
+        ]
+    
+    def _apply_rules(
+        self,
+        base_score: float,
+        features: Dict[str, Any],
+    ) -> tuple[float, List[ContextualAdjustment]]:
+        """Evaluate all rules against extracted features and apply their points"""
+        total_adjustment, adjustments_applied = self._evaluate_rules(features)
+        
+        adjusted_score = max(MIN_SCORE, min(MAX_SCORE, base_score + total_adjustment))
+        
+        return adjusted_score, adjustments_applied
+    
+    def _evaluate_rules(
+        self,
+        features: Dict[str, Any],
+    ) -> tuple[float, List[ContextualAdjustment]]:
+        """Return the summed points and adjustment records of all rules that apply"""
+        adjustments_applied = []
+        total_adjustment = 0.0
+        
         # Evaluate each rule
-        for rule in sorted(self.rules, key=lambda r: r.priority, reverse=True):
+        for rule in self._rules_by_priority:
             if self._rule_applies(rule, features):
                 # Calculate points
                 points = rule.points
                 
                 # Create adjustment record
                 adjustment = ContextualAdjustment(
-                    rule_id=rule.rule_id,
+                    rule_code=rule.rule_id,
                     rule_name=rule.rule_name,
                     adjustment_type=rule.adjustment_type,
-                    points=points,
+                    impact=points,
                     reason=rule.description,
                     confidence=0.95,  # High confidence in explicit rules
                     triggered_by=self._get_trigger_features(rule, features),
@@ -269,17 +352,33 @@ class ContextualAdjuster:
                 adjustments_applied.append(adjustment)
                 total_adjustment += points
         
-        adjusted_score = max(0, min(100, base_score + total_adjustment))
+        return total_adjustment, adjustments_applied
+    
+    def _extract_job_features(self, job: Job) -> Dict[str, Any]:
+        """Extract the job-only values rule features are derived from"""
+        required_skills = job.required_skills or []
+        
+        if job.salary_min and job.salary_max and job.salary_max > job.salary_min:
+            salary_range = job.salary_max - job.salary_min
+        else:
+            salary_range = None
         
-        return adjusted_score, adjustments_applied
+        return {
+            'required_skills': frozenset(required_skills),
+            'required_skills_count': len(required_skills),
+            'salary_range': salary_range,
+        }
     
     def _extract_features(
         self,
         job: Job,
         candidate: Candidate,
         section_scores: Dict[str, int],
+        job_features: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Extract features needed for rule evaluation"""
+        if job_features is None:
+            job_features = self._extract_job_features(job)
         
         features = {}
         
@@ -288,8 +387,9 @@ class ContextualAdjuster:
         
         # === SKILL MATCH RATE ===
         if job.required_skills and hasattr(candidate, 'skills'):
-            matched = len([s for s in candidate.skills if s in job.required_skills])
-            total = len(job.required_skills)
+            required = job_features['required_skills']
+            matched = sum(1 for s in candidate.skills if s in required)
+            total = job_features['required_skills_count']
             features['required_skills_match_rate'] = matched / total if total > 0 else 0
         else:
             features['required_skills_match_rate'] = 0
@@ -302,10 +402,9 @@ class ContextualAdjuster:
             features['experience_over_max_years'] = 0
         
         # === SALARY POSITION ===
-        if job.min_salary and job.max_salary and job.max_salary > job.min_salary:
-            midpoint = (job.min_salary + job.max_salary) / 2
-            range_size = job.max_salary - job.min_salary
-            features['salary_position'] = (candidate.expected_salary - job.min_salary) / range_size
+        range_size = job_features['salary_range']
+        if range_size is not None:
+            features['salary_position'] = (candidate.expected_salary - job.salary_min) / range_size
         else:
             features['salary_position'] = 0.5  # Default to midpoint
         
@@ -318,23 +417,27 @@ class ContextualAdjuster:
         else:
             features['years_since_graduation'] = 999
         
-        # === CAREER PATTERNS ===
-        if candidate.employment_history and len(candidate.employment_history) >= 3:
+        # === CAREER PATTERNS & PROGRESSION ===
+        # One pass over employment history: short tenures (job hopping) and
+        # progression keywords in job titles
+        history = candidate.employment_history or []
+        short_tenures = 0
+        has_progression = False
+        for emp in history:
+            if emp.duration_months and emp.duration_months < 24:
+                short_tenures += 1
+            if not has_progression and emp.job_title:
+                title = emp.job_title.lower()
+                has_progression = any(kw in title for kw in self.PROGRESSION_KEYWORDS)
+        
+        if len(history) >= 3:
             # Simplified job hopping detection
-            recent_jobs = [emp for emp in candidate.employment_history if emp.duration_months and emp.duration_months < 24]
-            features['jobs_in_recent_years'] = {'jobs': len(recent_jobs), 'years': 2}
+            features['jobs_in_recent_years'] = {'jobs': short_tenures, 'years': 2}
         else:
             features['jobs_in_recent_years'] = {'jobs': 0, 'years': 999}
         
-        # === CAREER PROGRESSION ===
         # Simple heuristic: if job titles contain progression keywords
-        progression_keywords = ['senior', 'lead', 'principal', 'director', 'manager', 'head']
-        if candidate.employment_history and len(candidate.employment_history) >= 2:
-            titles = [emp.job_title.lower() for emp in candidate.employment_history if emp.job_title]
-            has_progression = any(kw in ' '.join(titles) for kw in progression_keywords)
-            features['has_career_progression'] = has_progression
-        else:
-            features['has_career_progression'] = False
+        features['has_career_progression'] = len(history) >= 2 and has_progression
         
         # === INDUSTRY CONTINUITY ===
         # Placeholder - would need industry field in employment history
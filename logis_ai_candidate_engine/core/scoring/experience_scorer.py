@@ -1,7 +1,9 @@
 # Scores candidate's experience section
 # core/scoring/experience_scorer.py
 
-from typing import Optional
+from typing import List, Optional, Sequence
+
+import numpy as np
 
 
 class ExperienceScoringResult:
@@ -32,42 +34,98 @@ class ExperienceScorer:
         # Case 1: No max experience defined (common case)
         if max_experience_years is None:
             # Candidate at or above minimum gets full score
-            explanation = (
-                f"{candidate_experience_years:.1f} years experience "
-                f"against minimum requirement of {min_experience_years} years"
+            return ExperienceScoringResult(
+                score=100,
+                explanation=ExperienceScorer._explain(
+                    min_experience_years, max_experience_years, candidate_experience_years
+                ),
             )
-            return ExperienceScoringResult(score=100, explanation=explanation)
 
         # Case 2: Experience within defined range
         if candidate_experience_years <= max_experience_years:
             range_span = max_experience_years - min_experience_years
             if range_span == 0:
                 # Edge case: min == max
-                return ExperienceScoringResult(
-                    score=100,
-                    explanation=(
-                        f"{candidate_experience_years:.1f} years experience "
-                        f"matches exact requirement of {min_experience_years} years"
-                    ),
+                score = 100
+            else:
+                normalized = (
+                    (candidate_experience_years - min_experience_years) / range_span
                 )
+                score = int(round(70 + (normalized * 30)))  # 70 → 100 range
+
+            return ExperienceScoringResult(
+                score=score,
+                explanation=ExperienceScorer._explain(
+                    min_experience_years, max_experience_years, candidate_experience_years
+                ),
+            )
+
+        # Case 3: Overqualified candidate (above max)
+        # Mild penalty, not rejection
+        return ExperienceScoringResult(
+            score=85,
+            explanation=ExperienceScorer._explain(
+                min_experience_years, max_experience_years, candidate_experience_years
+            ),
+        )
+
+    @staticmethod
+    def score_many(
+        min_experience_years: int,
+        max_experience_years: Optional[int],
+        candidate_experience_years: Sequence[float],
+    ) -> List[ExperienceScoringResult]:
+        """
+        Score many candidates against one job's experience range.
+        Scores are computed in a single vectorized pass and match ``score``.
+        """
+        years = np.maximum(np.asarray(candidate_experience_years, dtype=np.float64), 0)
+
+        if max_experience_years is None:
+            scores = np.full(years.shape, 100)
+        else:
+            range_span = max_experience_years - min_experience_years
+            if range_span == 0:
+                in_range_scores = np.full(years.shape, 100.0)
+            else:
+                normalized = (years - min_experience_years) / range_span
+                in_range_scores = np.rint(70 + (normalized * 30))
+            scores = np.where(years <= max_experience_years, in_range_scores, 85)
 
-            normalized = (
-                (candidate_experience_years - min_experience_years) / range_span
+        return [
+            ExperienceScoringResult(
+                score=int(score),
+                explanation=ExperienceScorer._explain(
+                    min_experience_years, max_experience_years, float(year)
+                ),
             )
-            score = int(round(70 + (normalized * 30)))  # 70 → 100 range
+            for score, year in zip(scores.tolist(), years.tolist())
+        ]
 
-            explanation = (
+    @staticmethod
+    def _explain(
+        min_experience_years: int,
+        max_experience_years: Optional[int],
+        candidate_experience_years: float,
+    ) -> str:
+        if max_experience_years is None:
+            return (
                 f"{candidate_experience_years:.1f} years experience "
-                f"within required range ({min_experience_years}–{max_experience_years} years)"
+                f"against minimum requirement of {min_experience_years} years"
             )
 
-            return ExperienceScoringResult(score=score, explanation=explanation)
+        if candidate_experience_years <= max_experience_years:
+            if max_experience_years == min_experience_years:
+                return (
+                    f"{candidate_experience_years:.1f} years experience "
+                    f"matches exact requirement of {min_experience_years} years"
+                )
+            return (
+                f"{candidate_experience_years:.1f} years experience "
+                f"within required range ({min_experience_years}–{max_experience_years} years)"
+            )
 
-        # Case 3: Overqualified candidate (above max)
-        explanation = (
+        return (
             f"{candidate_experience_years:.1f} years experience "
             f"exceeds preferred maximum of {max_experience_years} years"
         )
-
-        # Mild penalty, not rejection
-        return ExperienceScoringResult(score=85, explanation=explanation)
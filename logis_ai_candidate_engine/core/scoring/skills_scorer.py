@@ -11,9 +11,11 @@ Author: Senior SDE
 Date: January 2, 2026
 """
 
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 from dataclasses import dataclass
-from sentence_transformers import SentenceTransformer
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily, only needed for type hints
+    from sentence_transformers import SentenceTransformer
 
 from logis_ai_candidate_engine.ml.skill_matcher import get_skill_matcher, SkillMatchResult, SkillMatch
 
@@ -62,7 +64,7 @@ class SkillsScorer:
     - Each match weighted by confidence (exact=1.0, synonym=0.95, semantic=0.85)
     """
 
-    def __init__(self, embedding_model: Optional[SentenceTransformer] = None):
+    def __init__(self, embedding_model: Optional["SentenceTransformer"] = None):
         """
         Initialize SkillsScorer with optional embedding model.
         
@@ -4,7 +4,7 @@
 # Maps parsed CV data to the Candidate schema for evaluation.
 # Handles data transformation, normalization, and enrichment.
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
 from logis_ai_candidate_engine.ml.cv_parser import (
@@ -55,6 +55,18 @@ class CVToCandidateMapper:
         'high_school': 'High School',
     }
     
+    # Substrings of normalized skill names that mark domain/IT skills
+    PROFESSIONAL_SKILL_KEYWORDS = (
+        'logistics', 'supply_chain', 'warehouse', 'transportation',
+        'procurement', 'inventory', 'erp', 'demand_planning', 'freight',
+        'customs', 'distribution', 'operations', 'six_sigma',
+    )
+    IT_SKILL_KEYWORDS = (
+        'python', 'java', 'sql', 'javascript', 'react', 'angular',
+        'aws', 'azure', 'docker', 'kubernetes', 'machine_learning',
+        'data_analysis', 'tensorflow', 'pytorch', 'tableau', 'power_bi',
+    )
+    
     def __init__(
         self,
         default_nationality: str = None,
@@ -171,60 +183,35 @@ class CVToCandidateMapper:
         
         return 0.0
     
+    @staticmethod
+    def _unique_normalized_skills(parsed_cv: ParsedCV) -> List[str]:
+        """Normalized skill names in first-seen order, without duplicates"""
+        return list(dict.fromkeys(s.normalized_skill for s in parsed_cv.skills))
+    
     def _extract_skills_list(self, parsed_cv: ParsedCV) -> List[str]:
         """Extract unique normalized skills from parsed CV"""
-        if not parsed_cv.skills:
-            return []
-        
-        # Use normalized skills, deduplicated
-        seen = set()
-        skills = []
-        
-        for skill_ext in parsed_cv.skills:
-            normalized = skill_ext.normalized_skill
-            if normalized not in seen:
-                skills.append(normalized.replace('_', ' ').title())
-                seen.add(normalized)
+        return [
+            normalized.replace('_', ' ').title()
+            for normalized in self._unique_normalized_skills(parsed_cv)
+        ]
+    
+    def _filter_skills(self, parsed_cv: ParsedCV, keywords: Tuple[str, ...]) -> Optional[List[str]]:
+        """Display names of skills whose normalized name contains any keyword"""
+        matched = {}
+        for normalized in self._unique_normalized_skills(parsed_cv):
+            normalized = normalized.lower()
+            if any(kw in normalized for kw in keywords):
+                matched.setdefault(normalized.replace('_', ' ').title())
         
-        return skills
+        return list(matched) if matched else None
     
     def _extract_professional_skills(self, parsed_cv: ParsedCV) -> List[str]:
         """Extract domain/professional skills (logistics, supply chain, etc.)"""
-        professional_keywords = [
-            'logistics', 'supply_chain', 'warehouse', 'transportation',
-            'procurement', 'inventory', 'erp', 'demand_planning', 'freight',
-            'customs', 'distribution', 'operations', 'six_sigma',
-        ]
-        
-        professional_skills = []
-        
-        for skill_ext in parsed_cv.skills:
-            normalized = skill_ext.normalized_skill.lower()
-            if any(kw in normalized for kw in professional_keywords):
-                skill_name = normalized.replace('_', ' ').title()
-                if skill_name not in professional_skills:
-                    professional_skills.append(skill_name)
-        
-        return professional_skills if professional_skills else None
+        return self._filter_skills(parsed_cv, self.PROFESSIONAL_SKILL_KEYWORDS)
     
     def _extract_it_skills(self, parsed_cv: ParsedCV) -> List[str]:
         """Extract IT/technical skills"""
-        it_keywords = [
-            'python', 'java', 'sql', 'javascript', 'react', 'angular',
-            'aws', 'azure', 'docker', 'kubernetes', 'machine_learning',
-            'data_analysis', 'tensorflow', 'pytorch', 'tableau', 'power_bi',
-        ]
-        
-        it_skills = []
-        
-        for skill_ext in parsed_cv.skills:
-            normalized = skill_ext.normalized_skill.lower()
-            if any(kw in normalized for kw in it_keywords):
-                skill_name = normalized.replace('_', ' ').title()
-                if skill_name not in it_skills:
-                    it_skills.append(skill_name)
-        
-        return it_skills if it_skills else None
+        return self._filter_skills(parsed_cv, self.IT_SKILL_KEYWORDS)
     
     def _map_employment_history(
         self, 
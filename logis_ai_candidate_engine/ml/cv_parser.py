@@ -9,22 +9,46 @@
 
 import re
 import os
-from dataclasses import dataclass, field
+import sys
+import threading
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Optional, Tuple, Set
 from datetime import datetime
 from pathlib import Path
 
 import yaml
 
+try:
+    import re2  # type: ignore  # google-re2: linear-time matching, no backtracking
+except ImportError:  # pragma: no cover
+    re2 = None
+
 # Import our embedding model for semantic matching
 from logis_ai_candidate_engine.ml.embedding_model import EmbeddingModel
 
+# Header lines made up only of phone-number characters are never names
+_NON_NAME_RE = re.compile(r'^[\d\+\-\(\)\s]+$')
+_DIGIT_RE = re.compile(r'\d')
+
 
 # =============================================================================
 # DATA CLASSES FOR PARSED CV STRUCTURE
 # =============================================================================
 
-@dataclass
+# A parsed CV holds many small records; on Python 3.10+ they are slotted,
+# dropping the per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _field_items(record):
+    """(name, value) pairs of a dataclass instance, slotted or not"""
+    return ((f.name, getattr(record, f.name)) for f in fields(record))
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ContactInfo:
     """Extracted contact information from CV"""
     email: Optional[str] = None
@@ -34,10 +58,10 @@ class ContactInfo:
     location: Optional[str] = None
     
     def to_dict(self) -> Dict:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ParsedExperience:
     """Structured work experience entry"""
     job_title: Optional[str] = None
@@ -50,10 +74,10 @@ class ParsedExperience:
     location: Optional[str] = None
     
     def to_dict(self) -> Dict:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ParsedEducation:
     """Structured education entry"""
     degree: Optional[str] = None
@@ -63,10 +87,10 @@ class ParsedEducation:
     location: Optional[str] = None
     
     def to_dict(self) -> Dict:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ParsedCertification:
     """Structured certification entry"""
     name: str
@@ -74,10 +98,10 @@ class ParsedCertification:
     year: Optional[int] = None
     
     def to_dict(self) -> Dict:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k, v in _field_items(self) if v is not None}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SkillExtraction:
     """Result of skill extraction with confidence"""
     skill: str
@@ -86,10 +110,10 @@ class SkillExtraction:
     source_section: str  # Which section of CV this was found in
     
     def to_dict(self) -> Dict:
-        return self.__dict__.copy()
+        return dict(_field_items(self))
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ParsedCV:
     """Complete parsed CV structure"""
     raw_text: str
@@ -125,6 +149,23 @@ class ParsedCV:
 # PATTERN MATCHERS - Regex-based extraction for structured data
 # =============================================================================
 
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _compile_linear(pattern: str, flags: int = 0):
+    """
+    Compile a backreference-free pattern with RE2 when google-re2 is installed,
+    falling back to the stdlib re engine otherwise (or if RE2 rejects it).
+    """
+    if re2 is not None:
+        inline = ''.join(char for flag, char in _RE2_INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
 class PatternMatcher:
     """
     Regex-based pattern matcher for structured data extraction.
@@ -132,28 +173,44 @@ class PatternMatcher:
     """
     
     # Email patterns
-    EMAIL_PATTERN = re.compile(
+    EMAIL_PATTERN = _compile_linear(
         r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
         re.IGNORECASE
     )
     
     # Phone patterns (international and local formats)
     PHONE_PATTERNS = [
-        re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
-        re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'),  # US format
-        re.compile(r'\b\d{10,12}\b'),  # Simple 10-12 digit numbers
+        _compile_linear(r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
+        _compile_linear(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'),  # US format
+        _compile_linear(r'\b\d{10,12}\b'),  # Simple 10-12 digit numbers
     ]
     
+    # Strips everything but digits and '+' when validating phone matches
+    _PHONE_CLEAN_RE = _compile_linear(r'[^\d+]')
+    # Phone matches only contain digits, a leading '+', parentheses and
+    # [-.\s] separators, so deleting those is usually all the cleaning needed
+    _PHONE_SEPARATORS = str.maketrans('', '', '-.() \t\n\r\f\v')
+    
     # LinkedIn URL pattern
-    LINKEDIN_PATTERN = re.compile(
+    LINKEDIN_PATTERN = _compile_linear(
         r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+/?',
         re.IGNORECASE
     )
     
+    # Email, LinkedIn and phone in a single alternation so contact details
+    # are collected in one scan; earlier branches win, so digits inside an
+    # email address or profile URL are never read as a phone number
+    CONTACT_PATTERN = _compile_linear(
+        r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+        r'|(?P<linkedin>(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+/?)'
+        r'|(?P<phone>\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9})',
+        re.IGNORECASE
+    )
+    
     # Date patterns for experience/education
     DATE_PATTERNS = [
         # Month Year - Month Year (e.g., "Jan 2020 - Dec 2023")
-        re.compile(
+        _compile_linear(
             r'(?P<start_month>Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|'
             r'Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s*'
             r'(?P<start_year>\d{4})\s*[-–—to]+\s*'
@@ -163,21 +220,23 @@ class PatternMatcher:
             re.IGNORECASE
         ),
         # MM/YYYY - MM/YYYY format
-        re.compile(
+        _compile_linear(
             r'(?P<start>\d{1,2}/\d{4})\s*[-–—to]+\s*(?P<end>\d{1,2}/\d{4}|Present|Current)',
             re.IGNORECASE
         ),
         # YYYY - YYYY format
-        re.compile(
+        _compile_linear(
             r'(?P<start_year>\d{4})\s*[-–—to]+\s*(?P<end_year>\d{4}|Present|Current)',
             re.IGNORECASE
         ),
     ]
     
     # Year pattern for education
-    YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+    YEAR_PATTERN = _compile_linear(r'\b(19|20)\d{2}\b')
     
-    # Degree patterns
+    # Degree patterns. Only ever searched within a single education line, where
+    # RE2's per-call setup costs more than the scan; these bounded literal
+    # alternations can't backtrack catastrophically, so they use the stdlib engine
     DEGREE_PATTERNS = {
         'phd': re.compile(r'\b(?:Ph\.?D\.?|Doctor(?:ate)?|D\.Phil)\b', re.IGNORECASE),
         'masters': re.compile(
@@ -203,24 +262,36 @@ class PatternMatcher:
         'operations', 'freight', 'shipping', 'inventory', 'distribution',
     ]
     
+    # Single alternation over all keywords (substring semantics, one scan)
+    _JOB_TITLE_RE = _compile_linear('|'.join(map(re.escape, JOB_TITLE_KEYWORDS)), re.IGNORECASE)
+    
     @classmethod
     def extract_emails(cls, text: str) -> List[str]:
         """Extract all email addresses from text"""
-        return list(set(cls.EMAIL_PATTERN.findall(text)))
+        return list({match.group(0) for match in cls.EMAIL_PATTERN.finditer(text)})
     
     @classmethod
     def extract_phones(cls, text: str) -> List[str]:
         """Extract all phone numbers from text"""
         phones = []
         for pattern in cls.PHONE_PATTERNS:
-            matches = pattern.findall(text)
-            for match in matches:
+            for match in pattern.finditer(text):
+                match = match.group(0)
                 # Clean and validate
-                cleaned = re.sub(r'[^\d+]', '', match)
+                cleaned = cls._clean_phone(match)
                 if 7 <= len(cleaned) <= 15:  # Valid phone length
                     phones.append(match.strip())
         return list(set(phones))[:2]  # Return max 2 phone numbers
     
+    @classmethod
+    def _clean_phone(cls, phone: str) -> str:
+        """Reduce a phone match to its digits and '+'"""
+        cleaned = phone.translate(cls._PHONE_SEPARATORS)
+        if not cleaned.lstrip('+').isdecimal():
+            # Unusual whitespace (stdlib \s is Unicode-aware); clean generically
+            cleaned = cls._PHONE_CLEAN_RE.sub('', phone)
+        return cleaned
+    
     @classmethod
     def extract_linkedin(cls, text: str) -> Optional[str]:
         """Extract LinkedIn URL from text"""
@@ -237,6 +308,7 @@ class PatternMatcher:
                 groups = match.groupdict()
                 date_ranges.append({
                     'raw': match.group(0),
+                    'offset': match.start(),
                     'start': groups.get('start') or groups.get('start_year'),
                     'end': groups.get('end') or groups.get('end_year') or groups.get('end_month'),
                     'start_month': groups.get('start_month'),
@@ -250,12 +322,7 @@ class PatternMatcher:
     @classmethod
     def extract_years(cls, text: str) -> List[int]:
         """Extract all 4-digit years from text"""
-        matches = cls.YEAR_PATTERN.findall(text)
-        return sorted([int(f"{prefix}{suffix}") 
-                      for prefix, suffix in [(m[:2], m[2:]) for m in 
-                                             [cls.YEAR_PATTERN.search(text).group() 
-                                              for _ in range(len(matches))]]]
-                      if matches else [])
+        return sorted(int(match.group(0)) for match in cls.YEAR_PATTERN.finditer(text))
     
     @classmethod
     def detect_degree_level(cls, text: str) -> Optional[str]:
@@ -268,14 +335,111 @@ class PatternMatcher:
     @classmethod
     def is_likely_job_title(cls, text: str) -> bool:
         """Check if text looks like a job title"""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in cls.JOB_TITLE_KEYWORDS)
+        return cls._JOB_TITLE_RE.search(text) is not None
 
 
 # =============================================================================
 # SECTION DETECTOR - Identifies CV sections using keywords and semantics
 # =============================================================================
 
+def _is_word_char(char: str) -> bool:
+    """Mirror of the regex \\w class used for word-boundary checks"""
+    return char.isalnum() or char == '_'
+
+
+class _KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed keyword set.
+    Finds every keyword occurrence in one linear pass over the text,
+    instead of one scan per keyword.
+    """
+    
+    def __init__(self, keywords):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    nxt = len(self._goto) - 1
+                    self._goto[state][char] = nxt
+                state = nxt
+            self._output[state].append(keyword)
+        
+        # Breadth-first pass to wire failure links and merge suffix outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+    
+    def iter_matches(self, text: str):
+        """Yield (start, keyword) for every occurrence, including overlapping ones."""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            
+            for keyword in output[state]:
+                yield i - len(keyword) + 1, keyword
+    
+    def iter_word_matches(self, text: str):
+        """
+        Yield (start, keyword) for every occurrence that sits on word
+        boundaries, with the same semantics as r'\\b' + keyword + r'\\b'.
+        """
+        length = len(text)
+        
+        for start, keyword in self.iter_matches(text):
+            end = start + len(keyword)
+            before = start > 0 and _is_word_char(text[start - 1])
+            if before == _is_word_char(keyword[0]):
+                continue
+            after = end < length and _is_word_char(text[end])
+            if after == _is_word_char(keyword[-1]):
+                continue
+            yield start, keyword
+
+
+def _build_section_keyword_index(
+    section_keywords: Dict[str, List[str]],
+) -> Tuple[_KeywordAutomaton, Dict[str, int], Dict[str, int]]:
+    """
+    Precompute lookup structures for SectionDetector keyword matching.
+    
+    Returns:
+        - An automaton reporting every keyword occurrence in one pass
+        - keyword -> section rank
+        - every substring of every keyword -> lowest section rank containing it
+    """
+    keyword_rank: Dict[str, int] = {}
+    substring_rank: Dict[str, int] = {}
+    
+    for rank, keywords in enumerate(section_keywords.values()):
+        for kw in keywords:
+            keyword_rank.setdefault(kw, rank)
+            for start in range(len(kw) + 1):
+                for end in range(start, len(kw) + 1):
+                    substring_rank.setdefault(kw[start:end], rank)
+    
+    return _KeywordAutomaton(keyword_rank), keyword_rank, substring_rank
+
+
 class SectionDetector:
     """
     Detects and segments CV sections using keyword matching
@@ -316,6 +480,11 @@ class SectionDetector:
         ],
     }
     
+    _SECTION_NAMES = list(SECTION_KEYWORDS)
+    _KEYWORD_AUTOMATON, _KEYWORD_RANK, _SUBSTRING_RANK = _build_section_keyword_index(
+        SECTION_KEYWORDS
+    )
+    
     # Patterns for section headers
     HEADER_PATTERN = re.compile(
         r'^[\s]*([A-Z][A-Za-z\s&/]+)[\s]*[:\-–—]*[\s]*$',
@@ -325,6 +494,7 @@ class SectionDetector:
     def __init__(self):
         self._embedding_model = None
         self._section_embeddings = None
+        self._section_labels = None
     
     def _get_embedding_model(self):
         """Lazy load embedding model"""
@@ -336,8 +506,8 @@ class SectionDetector:
         return self._embedding_model
     
     def _get_section_embeddings(self):
-        """Get embeddings for section keywords (cached)"""
-        if self._section_embeddings is None:
+        """Get stacked embedding matrix for section keywords (cached)"""
+        if self._section_labels is None:
             all_keywords = []
             keyword_to_section = {}
             
@@ -347,88 +517,149 @@ class SectionDetector:
                     keyword_to_section[kw] = section
             
             try:
-                embeddings = EmbeddingModel.encode(all_keywords)
-                self._section_embeddings = {
-                    kw: emb for kw, emb in zip(all_keywords, embeddings)
-                }
-                self._keyword_to_section = keyword_to_section
+                self._section_embeddings = self._load_keyword_embeddings(all_keywords)
+                self._section_labels = [keyword_to_section[kw] for kw in all_keywords]
             except Exception:
-                self._section_embeddings = {}
-                self._keyword_to_section = {}
+                self._section_embeddings = None
+                self._section_labels = []
         
-        return self._section_embeddings, self._keyword_to_section
+        return self._section_embeddings, self._section_labels
     
-    def detect_section(self, header_text: str) -> Tuple[Optional[str], float]:
+    @staticmethod
+    def _load_keyword_embeddings(keywords: List[str]):
+        """Encode section keywords through the persistent on-disk embedding cache"""
+        return EmbeddingModel.encode_persistent(keywords, "sectionemb")
+    
+    def _match_keywords(self, header_clean: str) -> Optional[str]:
         """
-        Detect which section a header belongs to.
-        Returns (section_name, confidence_score)
+        Exact/substring match of a lowercased header against section keywords.
+        Equivalent to checking ``kw in header or header in kw`` for every
+        keyword in section order, using one automaton pass and one dict lookup.
         """
-        header_clean = header_text.strip().lower()
-        
-        # First try exact/substring matching
-        for section, keywords in self.SECTION_KEYWORDS.items():
-            for kw in keywords:
-                if kw in header_clean or header_clean in kw:
-                    return section, 1.0
+        best_rank = self._SUBSTRING_RANK.get(header_clean, len(self._SECTION_NAMES))
+        for _, keyword in self._KEYWORD_AUTOMATON.iter_matches(header_clean):
+            rank = self._KEYWORD_RANK[keyword]
+            if rank < best_rank:
+                best_rank = rank
+        
+        if best_rank < len(self._SECTION_NAMES):
+            return self._SECTION_NAMES[best_rank]
+        return None
+    
+    def _match_semantic(self, headers: List[str]) -> List[Tuple[Optional[str], float]]:
+        """
+        Semantically match a batch of headers against section keywords.
+        Encodes all headers in a single call and resolves each row by argmax.
+        """
+        if not headers:
+            return []
         
-        # Try semantic matching if available
         try:
             import numpy as np
-            section_embeddings, keyword_to_section = self._get_section_embeddings()
+            section_matrix, section_labels = self._get_section_embeddings()
             
-            if section_embeddings:
-                header_embedding = EmbeddingModel.encode([header_text])[0]
-                
-                best_match = None
-                best_score = 0.0
-                
-                for kw, kw_embedding in section_embeddings.items():
-                    similarity = float(np.dot(header_embedding, kw_embedding))
-                    if similarity > best_score:
-                        best_score = similarity
-                        best_match = keyword_to_section.get(kw)
+            if section_matrix is not None and section_labels:
+                header_matrix = EmbeddingModel.encode(headers)
+                similarities = header_matrix @ section_matrix.T
+                best_idx = similarities.argmax(axis=1)
                 
-                if best_score >= 0.6:  # Threshold for semantic match
-                    return best_match, best_score
+                results = []
+                for row, idx in enumerate(best_idx):
+                    best_score = float(similarities[row, idx])
+                    if best_score >= 0.6:  # Threshold for semantic match
+                        results.append((section_labels[idx], best_score))
+                    else:
+                        results.append((None, 0.0))
+                return results
         except Exception:
             pass
         
-        return None, 0.0
+        return [(None, 0.0)] * len(headers)
+    
+    def detect_section(self, header_text: str) -> Tuple[Optional[str], float]:
+        """
+        Detect which section a header belongs to.
+        Returns (section_name, confidence_score)
+        """
+        # First try exact/substring matching
+        section = self._match_keywords(header_text.strip().lower())
+        if section:
+            return section, 1.0
+        
+        # Try semantic matching if available
+        return self._match_semantic([header_text])[0]
     
     def segment_cv(self, text: str) -> Dict[str, str]:
         """
         Segment CV text into sections.
         Returns dict mapping section names to their content.
         """
+        sections, _ = self.segment_cv_with_lower(text)
+        return sections
+    
+    def segment_cv_with_lower(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Segment CV text into sections, also returning lowercased section content.
+        The CV is lowercased once and the lowered lines are reused for keyword
+        matching and for the lowered sections handed to downstream extractors.
+        """
         sections = {}
+        sections_lower = {}
         lines = text.split('\n')
         
-        current_section = 'header'  # First part is typically name/contact
-        current_content = []
+        if text_lower is None:
+            text_lower = text.lower()
+        if len(text_lower) == len(text):
+            lines_lower = text_lower.split('\n')
+        else:
+            # Some Unicode characters change length when lowered; realign per line
+            lines_lower = [line.lower() for line in lines]
         
-        for line in lines:
-            # Check if this line looks like a section header
+        # Pass 1: resolve header candidates, batching the semantic fallback
+        detected: Dict[int, Tuple[Optional[str], float]] = {}
+        pending: List[Tuple[int, str]] = []
+        
+        for i, line in enumerate(lines):
             stripped = line.strip()
             
             if stripped and len(stripped) < 50:  # Headers are typically short
-                section, confidence = self.detect_section(stripped)
-                
-                if section and confidence >= 0.6:
-                    # Save previous section
-                    if current_content:
-                        sections[current_section] = '\n'.join(current_content).strip()
-                    
-                    current_section = section
-                    current_content = []
-                    continue
+                section = self._match_keywords(lines_lower[i].strip())
+                if section:
+                    detected[i] = (section, 1.0)
+                else:
+                    pending.append((i, stripped))
+        
+        semantic_results = self._match_semantic([header for _, header in pending])
+        for (i, _), result in zip(pending, semantic_results):
+            detected[i] = result
+        
+        # Pass 2: split lines into sections, visiting only the header lines
+        current_section = 'header'  # First part is typically name/contact
+        current_start = 0
+        boundaries = sorted(
+            (i, section) for i, (section, confidence) in detected.items()
+            if section and confidence >= 0.6
+        )
+        
+        for i, section in boundaries:
+            # Save previous section
+            if i > current_start:
+                sections[current_section] = '\n'.join(lines[current_start:i]).strip()
+                sections_lower[current_section] = '\n'.join(lines_lower[current_start:i]).strip()
             
-            current_content.append(line)
+            current_section = section
+            current_start = i + 1
         
         # Save last section
-        if current_content:
-            sections[current_section] = '\n'.join(current_content).strip()
+        if len(lines) > current_start:
+            sections[current_section] = '\n'.join(lines[current_start:]).strip()
+            sections_lower[current_section] = '\n'.join(lines_lower[current_start:]).strip()
         
-        return sections
+        return sections, sections_lower
 
 
 # =============================================================================
@@ -441,8 +672,21 @@ class SkillExtractor:
     Performs both exact matching and fuzzy/semantic matching.
     """
     
+    # Upper bound on distinct skills per call; bounds work on CVs listing hundreds of tools
+    MAX_SKILLS = 80
+    
+    # Scans the whole CV text, so it goes through the linear-time engine when available
+    _SKILL_LIST_RE = _compile_linear(
+        r'(?:^|\n)\s*[-•*]\s*([^:\n]+?)(?:\n|$)|'  # Bullet points
+        r'(?:skills?|technologies?|tools?)[\s:]+([^.\n]+)',  # After "skills:"
+        re.IGNORECASE
+    )
+    _SKILL_DELIMITER_RE = re.compile(r'[,;|/]')
+    
     _taxonomy: Optional[Dict] = None
     _all_skills: Optional[Set[str]] = None
+    _synonym_to_canonical: Optional[Dict[str, str]] = None
+    _skill_automaton: Optional[_KeywordAutomaton] = None
     
     @classmethod
     def _load_taxonomy(cls) -> Dict:
@@ -475,41 +719,73 @@ class SkillExtractor:
         
         return cls._all_skills
     
+    @classmethod
+    def _get_skill_automaton(cls) -> _KeywordAutomaton:
+        """Get the Aho-Corasick automaton over all known skills (built once)"""
+        if cls._skill_automaton is None:
+            cls._skill_automaton = _KeywordAutomaton(cls._get_all_skills())
+        
+        return cls._skill_automaton
+    
+    @classmethod
+    def _get_synonym_map(cls) -> Dict[str, str]:
+        """
+        Get lowercased synonym -> canonical lookup (first canonical listed wins).
+        Lowercased canonical names map to themselves, so every extraction of a
+        skill shares one normalized string instead of allocating its own.
+        """
+        if cls._synonym_to_canonical is None:
+            synonym_map: Dict[str, str] = {}
+            synonyms_by_canonical = cls._load_taxonomy().get('synonyms', {})
+            for canonical, synonyms in synonyms_by_canonical.items():
+                for syn in synonyms:
+                    synonym_map.setdefault(syn.lower(), canonical)
+            for canonical in synonyms_by_canonical:
+                canonical_lower = sys.intern(canonical.lower())
+                synonym_map.setdefault(canonical_lower, canonical_lower)
+            cls._synonym_to_canonical = synonym_map
+        
+        return cls._synonym_to_canonical
+    
     @classmethod
     def _normalize_skill(cls, skill: str) -> str:
         """Normalize a skill string"""
-        taxonomy = cls._load_taxonomy()
         skill_lower = skill.lower().strip()
         
-        # Check if it's a synonym and return canonical form
-        for canonical, synonyms in taxonomy.get('synonyms', {}).items():
-            if skill_lower in [s.lower() for s in synonyms]:
-                return canonical
-        
-        return skill_lower
+        # Map synonyms to their canonical form
+        return cls._get_synonym_map().get(skill_lower, skill_lower)
     
     def extract_skills(
         self, 
         text: str, 
-        section: str = 'unknown'
+        section: str = 'unknown',
+        text_lower: Optional[str] = None,
     ) -> List[SkillExtraction]:
         """
         Extract skills from text using multiple strategies:
         1. Direct matching against taxonomy
         2. Pattern matching for common skill formats
         3. Context-aware extraction
+        
+        Callers that already hold a lowercased copy of ``text`` can pass it
+        as ``text_lower`` to skip lowering it again.
         """
         extracted = []
         seen_normalized = set()
         all_skills = self._get_all_skills()
         
         # Strategy 1: Direct matching against known skills
-        text_lower = text.lower()
-        
-        for skill in all_skills:
-            # Use word boundary matching to avoid partial matches
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Single automaton pass, word-boundary matches only, in text order
+        seen_skills = set()
+        for _, skill in self._get_skill_automaton().iter_word_matches(text_lower):
+            if len(seen_normalized) >= self.MAX_SKILLS:
+                return extracted
+            
+            if skill not in seen_skills:
+                seen_skills.add(skill)
                 normalized = self._normalize_skill(skill)
                 
                 if normalized not in seen_normalized:
@@ -522,17 +798,14 @@ class SkillExtractor:
                     seen_normalized.add(normalized)
         
         # Strategy 2: Extract from skill-like patterns (bullet points, comma lists)
-        skill_list_pattern = re.compile(
-            r'(?:^|\n)\s*[-•*]\s*([^:\n]+?)(?:\n|$)|'  # Bullet points
-            r'(?:skills?|technologies?|tools?)[\s:]+([^.\n]+)',  # After "skills:"
-            re.IGNORECASE
-        )
-        
-        for match in skill_list_pattern.finditer(text):
+        for match in self._SKILL_LIST_RE.finditer(text):
+            if len(seen_normalized) >= self.MAX_SKILLS:
+                break
+            
             matched_text = match.group(1) or match.group(2)
             if matched_text:
                 # Split by common delimiters
-                potential_skills = re.split(r'[,;|/]', matched_text)
+                potential_skills = self._SKILL_DELIMITER_RE.split(matched_text)
                 
                 for skill_candidate in potential_skills:
                     skill_clean = skill_candidate.strip()
@@ -578,6 +851,12 @@ class ExperienceExtractor:
         'limited', 'pvt', 'private', 'co', 'co.', 'company', 'group',
         'technologies', 'solutions', 'services', 'consulting', 'systems',
     ]
+    _COMPANY_SUFFIX_RE = re.compile('|'.join(map(re.escape, COMPANY_SUFFIXES)), re.IGNORECASE)
+    _AT_SEPARATOR_RE = re.compile(r'\s+at\s+', re.IGNORECASE)
+    _FOUR_DIGITS_RE = re.compile(r'\d{4}')
+    _MONTH_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', re.IGNORECASE)
+    _MONTHS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun',
+               'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
     
     def extract_experiences(self, text: str) -> List[ParsedExperience]:
         """Extract work experiences from text"""
@@ -592,6 +871,19 @@ class ExperienceExtractor:
             return self._extract_unstructured(text)
         
         lines = text.split('\n')
+        
+        # Map each date range to the line it starts on (first match wins)
+        line_starts = []
+        offset = 0
+        for line in lines:
+            line_starts.append(offset)
+            offset += len(line) + 1
+        
+        date_range_by_line: Dict[int, Dict] = {}
+        for dr in date_ranges:
+            line_idx = bisect_right(line_starts, dr['offset']) - 1
+            date_range_by_line.setdefault(line_idx, dr)
+        
         current_exp = None
         current_responsibilities = []
         
@@ -602,9 +894,9 @@ class ExperienceExtractor:
                 continue
             
             # Check if this line contains a date range
-            has_date = any(dr['raw'] in line for dr in date_ranges)
+            dr = date_range_by_line.get(i)
             
-            if has_date or PatternMatcher.is_likely_job_title(stripped):
+            if dr or PatternMatcher.is_likely_job_title(stripped):
                 # Save previous experience
                 if current_exp:
                     if current_responsibilities:
@@ -618,23 +910,21 @@ class ExperienceExtractor:
                 self._parse_experience_header(stripped, current_exp)
                 
                 # Extract date range
-                for dr in date_ranges:
-                    if dr['raw'] in line:
-                        current_exp.start_date = dr.get('start') or dr.get('start_year')
-                        end = dr.get('end') or dr.get('end_year')
-                        
-                        if end and end.lower() in ['present', 'current']:
-                            current_exp.is_current = True
-                            current_exp.end_date = 'Present'
-                        else:
-                            current_exp.end_date = end
-                        
-                        # Calculate duration
-                        current_exp.duration_months = self._calculate_duration(
-                            current_exp.start_date, 
-                            current_exp.end_date
-                        )
-                        break
+                if dr:
+                    current_exp.start_date = dr.get('start') or dr.get('start_year')
+                    end = dr.get('end') or dr.get('end_year')
+                    
+                    if end and end.lower() in ['present', 'current']:
+                        current_exp.is_current = True
+                        current_exp.end_date = 'Present'
+                    else:
+                        current_exp.end_date = end
+                    
+                    # Calculate duration
+                    current_exp.duration_months = self._calculate_duration(
+                        current_exp.start_date, 
+                        current_exp.end_date
+                    )
             
             elif current_exp and (stripped.startswith('-') or stripped.startswith('•')):
                 # This is likely a responsibility bullet point
@@ -671,7 +961,7 @@ class ExperienceExtractor:
         
         # Try "at" separator
         if ' at ' in text.lower():
-            parts = re.split(r'\s+at\s+', text, flags=re.IGNORECASE)
+            parts = self._AT_SEPARATOR_RE.split(text)
             if len(parts) >= 2:
                 exp.job_title = parts[0].strip()
                 exp.company_name = parts[1].strip()
@@ -686,7 +976,7 @@ class ExperienceExtractor:
                     part_clean = part.strip()
                     if PatternMatcher.is_likely_job_title(part_clean):
                         exp.job_title = part_clean
-                    elif any(suffix in part_clean.lower() for suffix in self.COMPANY_SUFFIXES):
+                    elif self._COMPANY_SUFFIX_RE.search(part_clean):
                         exp.company_name = part_clean
                 return
         
@@ -713,37 +1003,25 @@ class ExperienceExtractor:
         
         try:
             # Parse start year
-            start_year = int(re.search(r'\d{4}', start).group())
+            start_year = int(self._FOUR_DIGITS_RE.search(start).group())
             start_month = 1
             
             # Try to get month
-            month_match = re.search(
-                r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', 
-                start, 
-                re.IGNORECASE
-            )
+            month_match = self._MONTH_RE.search(start)
             if month_match:
-                months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 
-                         'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-                start_month = months.index(month_match.group().lower()[:3]) + 1
+                start_month = self._MONTHS.index(month_match.group().lower()[:3]) + 1
             
             # Parse end
             if not end or end.lower() in ['present', 'current']:
                 end_year = datetime.now().year
                 end_month = datetime.now().month
             else:
-                end_year = int(re.search(r'\d{4}', end).group())
+                end_year = int(self._FOUR_DIGITS_RE.search(end).group())
                 end_month = 12
                 
-                month_match = re.search(
-                    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', 
-                    end, 
-                    re.IGNORECASE
-                )
+                month_match = self._MONTH_RE.search(end)
                 if month_match:
-                    months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 
-                             'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-                    end_month = months.index(month_match.group().lower()[:3]) + 1
+                    end_month = self._MONTHS.index(month_match.group().lower()[:3]) + 1
             
             # Calculate months
             return (end_year - start_year) * 12 + (end_month - start_month)
@@ -766,6 +1044,7 @@ class EducationExtractor:
         'university', 'college', 'institute', 'school', 'academy',
         'polytechnic', 'iit', 'mit', 'stanford', 'harvard', 'oxford',
     ]
+    _UNIVERSITY_RE = re.compile('|'.join(map(re.escape, UNIVERSITY_KEYWORDS)), re.IGNORECASE)
     
     # Common fields of study
     FIELDS_OF_STUDY = [
@@ -776,6 +1055,7 @@ class EducationExtractor:
         'artificial intelligence', 'machine learning', 'electrical',
         'mechanical', 'civil', 'chemical', 'software',
     ]
+    _FIELD_OF_STUDY_RE = re.compile('|'.join(map(re.escape, FIELDS_OF_STUDY)), re.IGNORECASE)
     
     def extract_education(self, text: str) -> List[ParsedEducation]:
         """Extract education entries from text"""
@@ -799,27 +1079,29 @@ class EducationExtractor:
                 
                 current_edu = ParsedEducation(degree=degree_level)
                 
-                # Try to extract field of study
-                for field in self.FIELDS_OF_STUDY:
-                    if field.lower() in stripped.lower():
-                        current_edu.field_of_study = field.title()
-                        break
+                # Try to extract field of study (first match in list order)
+                found_fields = {m.lower() for m in self._FIELD_OF_STUDY_RE.findall(stripped)}
+                if found_fields:
+                    for field in self.FIELDS_OF_STUDY:
+                        if field in found_fields:
+                            current_edu.field_of_study = field.title()
+                            break
                 
                 # Extract year
-                year_match = re.search(r'\b(19|20)\d{2}\b', stripped)
+                year_match = PatternMatcher.YEAR_PATTERN.search(stripped)
                 if year_match:
                     current_edu.graduation_year = int(year_match.group())
                 
                 continue
             
             # Check for university
-            if current_edu and any(kw in stripped.lower() for kw in self.UNIVERSITY_KEYWORDS):
+            if current_edu and self._UNIVERSITY_RE.search(stripped):
                 current_edu.institution = stripped
                 continue
             
             # Check for year only
             if current_edu:
-                year_match = re.search(r'\b(19|20)\d{2}\b', stripped)
+                year_match = PatternMatcher.YEAR_PATTERN.search(stripped)
                 if year_match and not current_edu.graduation_year:
                     current_edu.graduation_year = int(year_match.group())
         
@@ -848,6 +1130,20 @@ class CVParser:
         print(result.experience)
     """
     
+    # Sum of the per-field weights in _calculate_confidence
+    _CONFIDENCE_MAX_SCORE = 100.0
+    
+    # Common language names
+    KNOWN_LANGUAGES = [
+        'english', 'arabic', 'hindi', 'urdu', 'french', 'spanish',
+        'german', 'mandarin', 'chinese', 'japanese', 'korean',
+        'portuguese', 'russian', 'italian', 'dutch', 'tamil',
+        'telugu', 'malayalam', 'bengali', 'punjabi', 'marathi',
+        'gujarati', 'kannada', 'tagalog', 'thai', 'vietnamese',
+    ]
+    _KNOWN_LANGUAGE_SET = frozenset(KNOWN_LANGUAGES)
+    _WORD_RE = re.compile(r'\w+')
+    
     def __init__(self):
         self.section_detector = SectionDetector()
         self.skill_extractor = SkillExtractor()
@@ -866,99 +1162,167 @@ class CVParser:
         """
         result = ParsedCV(raw_text=text)
         
+        # Step 1: Segment CV into sections (lowercasing the CV only once);
+        # nothing else can run without it
+        try:
+            sections, sections_lower = self.section_detector.segment_cv_with_lower(text)
+        except Exception as e:
+            result.parsing_warnings.append(f"Parsing error in segmentation: {str(e)}")
+            result.extraction_confidence = 0.0
+            return result
+        
+        # Steps 2-9 are independent of each other's failures: a failing step
+        # records a warning and the rest still contribute a partial result
+        steps = (
+            ('contact', self._parse_contact),
+            ('name', self._parse_name),
+            ('summary', self._parse_summary),
+            ('skills', self._parse_skills),
+            ('experience', self._parse_experience),
+            ('education', self._parse_education),
+            ('total experience', self._parse_total_experience),
+            ('languages', self._parse_languages),
+        )
+        for step_name, step in steps:
+            try:
+                step(result, text, sections, sections_lower)
+            except Exception as e:
+                result.parsing_warnings.append(f"Parsing error in {step_name}: {str(e)}")
+        
+        # Step 10: Calculate extraction confidence
         try:
-            # Step 1: Segment CV into sections
-            sections = self.section_detector.segment_cv(text)
-            
-            # Step 2: Extract contact information (from header section)
-            header_text = sections.get('header', text[:500])
-            result.contact = self._extract_contact(header_text)
-            
-            # Step 3: Extract name (from header section)
-            result.name = self._extract_name(header_text)
-            
-            # Step 4: Extract summary
-            if 'summary' in sections:
-                result.summary = sections['summary'][:500]  # Limit summary length
-            
-            # Step 5: Extract skills from all sections
-            all_skills = []
-            
-            # Prioritize skills section
-            if 'skills' in sections:
-                all_skills.extend(
-                    self.skill_extractor.extract_skills(sections['skills'], 'skills')
-                )
-            
-            # Also check experience and summary for skills
-            for section_name in ['experience', 'summary', 'header']:
-                if section_name in sections:
-                    section_skills = self.skill_extractor.extract_skills(
-                        sections[section_name], section_name
-                    )
-                    # Only add if not already found
-                    existing_normalized = {s.normalized_skill for s in all_skills}
-                    for skill in section_skills:
-                        if skill.normalized_skill not in existing_normalized:
-                            all_skills.append(skill)
-                            existing_normalized.add(skill.normalized_skill)
-            
-            result.skills = all_skills
-            
-            # Step 6: Extract experience
-            if 'experience' in sections:
-                result.experience = self.experience_extractor.extract_experiences(
-                    sections['experience']
-                )
-            
-            # Step 7: Extract education
-            if 'education' in sections:
-                result.education = self.education_extractor.extract_education(
-                    sections['education']
-                )
-            
-            # Step 8: Calculate total experience
-            result.total_experience_years = self._calculate_total_experience(
-                result.experience
-            )
-            
-            # Step 9: Extract languages
-            if 'languages' in sections:
-                result.languages = self._extract_languages(sections['languages'])
-            
-            # Step 10: Calculate extraction confidence
             result.extraction_confidence = self._calculate_confidence(result)
-            
         except Exception as e:
-            result.parsing_warnings.append(f"Parsing error: {str(e)}")
+            result.parsing_warnings.append(f"Parsing error in confidence: {str(e)}")
             result.extraction_confidence = 0.0
         
         return result
     
+    def _parse_contact(self, result, text, sections, sections_lower) -> None:
+        """Step 2: Extract contact information (from header section)"""
+        result.contact = self._extract_contact(sections.get('header', text[:500]))
+    
+    def _parse_name(self, result, text, sections, sections_lower) -> None:
+        """Step 3: Extract name (from header section)"""
+        result.name = self._extract_name(sections.get('header', text[:500]))
+    
+    def _parse_summary(self, result, text, sections, sections_lower) -> None:
+        """Step 4: Extract summary"""
+        if 'summary' in sections:
+            result.summary = sections['summary'][:500]  # Limit summary length
+    
+    def _parse_skills(self, result, text, sections, sections_lower) -> None:
+        """Step 5: Extract skills from all sections"""
+        all_skills = []
+        
+        # Prioritize skills section
+        if 'skills' in sections:
+            all_skills.extend(
+                self.skill_extractor.extract_skills(
+                    sections['skills'], 'skills', sections_lower['skills']
+                )
+            )
+        
+        # Also check experience and summary for skills
+        existing_normalized = {s.normalized_skill for s in all_skills}
+        for section_name in ['experience', 'summary', 'header']:
+            if section_name in sections:
+                section_skills = self.skill_extractor.extract_skills(
+                    sections[section_name], section_name, sections_lower[section_name]
+                )
+                # Only add if not already found
+                for skill in section_skills:
+                    if skill.normalized_skill not in existing_normalized:
+                        all_skills.append(skill)
+                        existing_normalized.add(skill.normalized_skill)
+        
+        result.skills = all_skills
+    
+    def _parse_experience(self, result, text, sections, sections_lower) -> None:
+        """Step 6: Extract experience"""
+        if 'experience' in sections:
+            result.experience = self.experience_extractor.extract_experiences(
+                sections['experience']
+            )
+    
+    def _parse_education(self, result, text, sections, sections_lower) -> None:
+        """Step 7: Extract education"""
+        if 'education' in sections:
+            result.education = self.education_extractor.extract_education(
+                sections['education']
+            )
+    
+    def _parse_total_experience(self, result, text, sections, sections_lower) -> None:
+        """Step 8: Calculate total experience"""
+        result.total_experience_years = self._calculate_total_experience(
+            result.experience
+        )
+    
+    def _parse_languages(self, result, text, sections, sections_lower) -> None:
+        """Step 9: Extract languages"""
+        if 'languages' in sections:
+            result.languages = self._extract_languages(
+                sections['languages'], sections_lower['languages']
+            )
+    
+    def parse_many(
+        self, 
+        texts: List[str], 
+        max_workers: Optional[int] = None
+    ) -> List[ParsedCV]:
+        """
+        Parse a batch of CV texts concurrently.
+        
+        Taxonomy, keyword index and compiled patterns are shared read-only
+        caches, so CVs can be parsed on a thread pool; RE2 and NumPy release
+        the GIL during matching and similarity scoring.
+        
+        Args:
+            texts: Raw CV text contents
+            max_workers: Thread pool size (defaults to the CPU count)
+            
+        Returns:
+            ParsedCV objects in the same order as ``texts``
+        """
+        if len(texts) <= 1:
+            return [self.parse(text) for text in texts]
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(texts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.parse, texts))
+    
     def _extract_contact(self, text: str) -> ContactInfo:
         """Extract contact information from header section"""
         contact = ContactInfo()
+        phones: List[str] = []
+        
+        # Single pass; the first email/profile and first two phones win
+        for match in PatternMatcher.CONTACT_PATTERN.finditer(text):
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == 'email':
+                if contact.email is None:
+                    contact.email = value
+            elif kind == 'linkedin':
+                if contact.linkedin_url is None:
+                    contact.linkedin_url = value
+            else:
+                phone = value.strip()
+                cleaned = PatternMatcher._clean_phone(phone)
+                if 7 <= len(cleaned) <= 15 and phone not in phones and len(phones) < 2:
+                    phones.append(phone)
         
-        # Extract email
-        emails = PatternMatcher.extract_emails(text)
-        if emails:
-            contact.email = emails[0]
-        
-        # Extract phone(s)
-        phones = PatternMatcher.extract_phones(text)
         if phones:
             contact.phone = phones[0]
             if len(phones) > 1:
                 contact.alternative_phone = phones[1]
         
-        # Extract LinkedIn
-        contact.linkedin_url = PatternMatcher.extract_linkedin(text)
-        
         return contact
     
     def _extract_name(self, text: str) -> Optional[str]:
         """Extract candidate name from header section"""
-        lines = text.split('\n')
+        # maxsplit keeps long headers from being split beyond the lines we check
+        lines = text.split('\n', 5)
         
         for line in lines[:5]:  # Check first 5 lines
             stripped = line.strip()
@@ -968,14 +1332,14 @@ class CVParser:
                 continue
             if '@' in stripped:
                 continue
-            if re.match(r'^[\d\+\-\(\)\s]+$', stripped):
+            if _NON_NAME_RE.match(stripped):
                 continue
             
             # Name is typically 2-4 words, title case
             words = stripped.split()
             if 2 <= len(words) <= 4:
                 # Check if it looks like a name (starts with capital, no numbers)
-                if all(w[0].isupper() for w in words if w) and not any(c.isdigit() for c in stripped):
+                if _DIGIT_RE.search(stripped) is None and all(w[0].isupper() for w in words):
                     return stripped
         
         return None
@@ -985,79 +1349,44 @@ class CVParser:
         experiences: List[ParsedExperience]
     ) -> Optional[float]:
         """Calculate total years of experience"""
-        total_months = 0
-        
-        for exp in experiences:
-            if exp.duration_months:
-                total_months += exp.duration_months
+        total_months = sum(exp.duration_months or 0 for exp in experiences)
         
         if total_months > 0:
             return round(total_months / 12, 1)
         
         return None
     
-    def _extract_languages(self, text: str) -> List[str]:
-        """Extract languages from languages section"""
-        languages = []
-        
-        # Common language names
-        known_languages = [
-            'english', 'arabic', 'hindi', 'urdu', 'french', 'spanish',
-            'german', 'mandarin', 'chinese', 'japanese', 'korean',
-            'portuguese', 'russian', 'italian', 'dutch', 'tamil',
-            'telugu', 'malayalam', 'bengali', 'punjabi', 'marathi',
-            'gujarati', 'kannada', 'tagalog', 'thai', 'vietnamese',
-        ]
-        
-        text_lower = text.lower()
-        
-        for lang in known_languages:
-            if lang in text_lower:
-                languages.append(lang.title())
+    def _extract_languages(self, text: str, text_lower: Optional[str] = None) -> List[str]:
+        """
+        Extract languages from languages section.
+        Pass an already lowercased copy as ``text_lower`` to skip lowering again.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
         
-        return languages
+        # Whole-word tokens probed against the set, reported in list order
+        found = self._KNOWN_LANGUAGE_SET.intersection(
+            match.group(0) for match in self._WORD_RE.finditer(text_lower)
+        )
+        return [lang.title() for lang in self.KNOWN_LANGUAGES if lang in found]
     
     def _calculate_confidence(self, result: ParsedCV) -> float:
         """
         Calculate overall extraction confidence score.
         Based on how many fields were successfully extracted.
         """
-        score = 0.0
-        max_score = 0.0
-        
-        # Name (important)
-        max_score += 15
-        if result.name:
-            score += 15
-        
-        # Contact (important)
-        max_score += 15
-        if result.contact.email:
-            score += 10
-        if result.contact.phone:
-            score += 5
-        
-        # Skills (very important)
-        max_score += 25
-        if result.skills:
-            score += min(25, len(result.skills) * 3)
-        
-        # Experience (very important)
-        max_score += 25
-        if result.experience:
-            score += min(25, len(result.experience) * 8)
-        
-        # Education
-        max_score += 15
-        if result.education:
-            score += min(15, len(result.education) * 8)
-        
-        # Summary
-        max_score += 5
-        if result.summary:
-            score += 5
-        
-        return round(min(score / max_score, 1.0), 2) if max_score > 0 else 0.0
+        contact = result.contact
+        score = (
+            15 * bool(result.name)                           # Name (important)
+            + 10 * bool(contact.email)                       # Contact (important)
+            + 5 * bool(contact.phone)
+            + min(25, len(result.skills) * 3)                # Skills (very important)
+            + min(25, len(result.experience) * 8)            # Experience (very important)
+            + min(15, len(result.education) * 8)             # Education
+            + 5 * bool(result.summary)                       # Summary
+        )
+        
+        return round(min(score / self._CONFIDENCE_MAX_SCORE, 1.0), 2)
     
     def parse_file(self, file_path: str) -> ParsedCV:
         """
@@ -1080,8 +1409,11 @@ class CVParser:
         ext = path.suffix.lower()
         
         if ext == '.txt':
-            with open(path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            # One read and one decode; apply universal-newline translation
+            # only when the file actually contains carriage returns
+            text = path.read_bytes().decode('utf-8')
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
             return self.parse(text)
         
         elif ext == '.pdf':
@@ -1111,6 +1443,22 @@ class CVParser:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+# Shared parser for the convenience functions (CVParser keeps no per-parse state)
+_default_parser: Optional[CVParser] = None
+_default_parser_lock = threading.Lock()
+
+
+def _get_default_parser() -> CVParser:
+    """Get or create the shared CVParser instance"""
+    global _default_parser
+    
+    if _default_parser is None:
+        with _default_parser_lock:
+            if _default_parser is None:
+                _default_parser = CVParser()
+    
+    return _default_parser
+
 def parse_cv(text: str) -> ParsedCV:
     """
     Convenience function to parse CV text.
@@ -1121,8 +1469,21 @@ def parse_cv(text: str) -> ParsedCV:
     Returns:
         ParsedCV object with all extracted information
     """
-    parser = CVParser()
-    return parser.parse(text)
+    return _get_default_parser().parse(text)
+
+
+def parse_cvs(texts: List[str], max_workers: Optional[int] = None) -> List[ParsedCV]:
+    """
+    Convenience function to parse a batch of CV texts concurrently.
+    
+    Args:
+        texts: Raw CV texts
+        max_workers: Thread pool size (defaults to the CPU count)
+        
+    Returns:
+        ParsedCV objects in input order
+    """
+    return _get_default_parser().parse_many(texts, max_workers=max_workers)
 
 
 def parse_cv_file(file_path: str) -> ParsedCV:
@@ -1135,5 +1496,4 @@ def parse_cv_file(file_path: str) -> ParsedCV:
     Returns:
         ParsedCV object with all extracted information
     """
-    parser = CVParser()
-    return parser.parse_file(file_path)
+    return _get_default_parser().parse_file(file_path)
@@ -1,17 +1,43 @@
 # Loads and manages embedding models for semantic matching
 # ml/embedding_model.py
+#
+# numpy and sentence-transformers are imported lazily so that code paths which
+# never encode text (rule-only scoring, stubbed tests) don't pay their import cost.
+
+from __future__ import annotations
 
 import hashlib
 import os
+import pickle
 import threading
-from typing import List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+
+# On-disk cache for fixed vocabularies (override with EMBEDDING_CACHE_DIR)
+EMBEDDING_CACHE_DIR = Path(
+    os.getenv("EMBEDDING_CACHE_DIR", Path.home() / ".cache" / "logis_ai_candidate_engine")
+).expanduser()
+
+_UNRESOLVED = object()
+_sentence_transformer_cls = _UNRESOLVED
 
-import numpy as np
 
-try:
-    from sentence_transformers import SentenceTransformer  # type: ignore
-except Exception:  # pragma: no cover
-    SentenceTransformer = None  # type: ignore
+def _get_sentence_transformer_cls():
+    """Import SentenceTransformer on first use; None if unavailable (result cached)."""
+    global _sentence_transformer_cls
+    if _sentence_transformer_cls is _UNRESOLVED:
+        try:
+            from sentence_transformers import SentenceTransformer  # type: ignore
+        except Exception:  # pragma: no cover
+            SentenceTransformer = None  # type: ignore
+        _sentence_transformer_cls = SentenceTransformer
+    return _sentence_transformer_cls
 
 
 class EmbeddingModel:
@@ -20,12 +46,22 @@ class EmbeddingModel:
     Responsible only for encoding text into vectors.
     """
 
-    _model: Optional["SentenceTransformer"] = None
+    DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+    ENCODE_BATCH_SIZE = 64
+
+    _model: Optional[SentenceTransformer] = None
+    _model_name: Optional[str] = None
     _lock = threading.Lock()
 
+    # Bounded LRU of per-text embeddings, keyed by (backend, text digest)
+    CACHE_SIZE = 10_000
+    _cache: OrderedDict[Tuple[str, bytes], np.ndarray] = OrderedDict()
+    _cache_lock = threading.Lock()
+
     @staticmethod
-    def load(model_name: str = "all-MiniLM-L6-v2") -> "SentenceTransformer":
-        if SentenceTransformer is None:
+    def load(model_name: str = DEFAULT_MODEL_NAME) -> SentenceTransformer:
+        sentence_transformer_cls = _get_sentence_transformer_cls()
+        if sentence_transformer_cls is None:
             raise RuntimeError("sentence-transformers is not available")
 
         resolved_name = os.getenv("EMBEDDING_MODEL_NAME", model_name)
@@ -33,30 +69,169 @@ class EmbeddingModel:
         if EmbeddingModel._model is None:
             with EmbeddingModel._lock:
                 if EmbeddingModel._model is None:
-                    EmbeddingModel._model = SentenceTransformer(resolved_name)
+                    model = sentence_transformer_cls(resolved_name)
+                    # Half precision halves activation bandwidth on GPU;
+                    # CPU inference stays in float32
+                    if getattr(model.device, "type", "cpu") == "cuda":
+                        model = model.half()
+                    EmbeddingModel._model = model
+                    EmbeddingModel._model_name = resolved_name
 
         return EmbeddingModel._model
 
     @staticmethod
-    def _fallback_encode(texts: List[str], dim: int = 384) -> List[List[float]]:
-        vectors: List[List[float]] = []
-        for text in texts:
-            tokens = [t for t in (text or "").lower().split() if t]
-            vec = np.zeros(dim, dtype=np.float32)
-            for tok in tokens:
-                digest = hashlib.sha256(tok.encode("utf-8")).digest()
-                idx = int.from_bytes(digest[:4], byteorder="little", signed=False) % dim
-                vec[idx] += 1.0
-            norm = float(np.linalg.norm(vec))
-            if norm > 0:
-                vec = vec / norm
-            vectors.append(vec.astype(float).tolist())
-        return vectors
+    @lru_cache(maxsize=65536)
+    def _token_bucket(token: str, dim: int) -> int:
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        return int.from_bytes(digest[:4], byteorder="little", signed=False) % dim
+
+    @staticmethod
+    def _fallback_encode(texts: List[str], dim: int = 384) -> np.ndarray:
+        import numpy as np
+
+        # Hashed bag-of-words: bucket every token of every text, offset by row,
+        # and count them all with a single bincount
+        buckets: List[int] = []
+        for row, text in enumerate(texts):
+            offset = row * dim
+            buckets.extend(
+                offset + EmbeddingModel._token_bucket(tok, dim)
+                for tok in (text or "").lower().split()
+            )
+
+        counts = np.bincount(
+            np.asarray(buckets, dtype=np.int64), minlength=len(texts) * dim
+        ).astype(np.float32).reshape(len(texts), dim)
+
+        norms = np.linalg.norm(counts, axis=1, keepdims=True)
+        return np.divide(counts, norms, out=counts, where=norms > 0)
+
+    @staticmethod
+    def encode(texts: List[str]) -> np.ndarray:
+        """
+        Encode texts into an (n, dim) float32 array of L2-normalized embeddings.
+        Repeated texts (e.g. one job description scored against many
+        candidates) are served from a bounded LRU cache.
+        """
+        return EmbeddingModel._encode(texts)[0]
 
     @staticmethod
-    def encode(texts: List[str]) -> List[List[float]]:
+    def _encode(texts: List[str]) -> Tuple[np.ndarray, bool]:
+        """
+        Encode texts, also reporting whether every row is transformer output
+        (False when the model is unavailable or fell back on any batch).
+        """
+        import numpy as np
+
         try:
             model = EmbeddingModel.load()
-            return model.encode(texts, normalize_embeddings=True).tolist()
+            backend = EmbeddingModel._model_name
         except Exception:
-            return EmbeddingModel._fallback_encode(texts)
+            model = None
+            backend = "fallback"
+
+        def _encode_uncached(batch: List[str]) -> Tuple[np.ndarray, str]:
+            """Encode a batch, returning the vectors and the backend that produced them"""
+            if model is not None:
+                try:
+                    vectors = model.encode(
+                        batch,
+                        batch_size=EmbeddingModel.ENCODE_BATCH_SIZE,
+                        normalize_embeddings=True,
+                        convert_to_numpy=True,
+                        show_progress_bar=False,
+                    )
+                    return np.asarray(vectors, dtype=np.float32), backend
+                except Exception:
+                    pass
+            return EmbeddingModel._fallback_encode(batch), "fallback"
+
+        if not texts:
+            encoded, produced_by = _encode_uncached(texts)
+            return encoded, produced_by != "fallback"
+
+        def _key(source: str, text: str) -> Tuple[str, bytes]:
+            return (source, hashlib.blake2b((text or "").encode("utf-8"), digest_size=16).digest())
+
+        keys = [_key(backend, text) for text in texts]
+        rows: List[Optional[np.ndarray]] = [None] * len(texts)
+        with EmbeddingModel._cache_lock:
+            for i, key in enumerate(keys):
+                cached = EmbeddingModel._cache.get(key)
+                if cached is not None:
+                    EmbeddingModel._cache.move_to_end(key)
+                    rows[i] = cached
+
+        from_model = backend != "fallback"
+        misses = [i for i, row in enumerate(rows) if row is None]
+        if misses:
+            encoded, produced_by = _encode_uncached([texts[i] for i in misses])
+            with EmbeddingModel._cache_lock:
+                for i, vector in zip(misses, encoded):
+                    vector = vector.copy()
+                    vector.flags.writeable = False
+                    rows[i] = vector
+                    # Rows are cached under the backend that actually produced
+                    # them, so a transient model failure never poisons the
+                    # model's entries with hashing vectors
+                    key = keys[i] if produced_by == backend else _key(produced_by, texts[i])
+                    EmbeddingModel._cache[key] = vector
+                while len(EmbeddingModel._cache) > EmbeddingModel.CACHE_SIZE:
+                    EmbeddingModel._cache.popitem(last=False)
+            if produced_by != backend and len(misses) < len(texts):
+                # Cached hits are model vectors; never mix them with hashing
+                # vectors in one result, since the two spaces are unrelated
+                return EmbeddingModel._fallback_encode(texts), False
+            from_model = from_model and produced_by == backend
+
+        return np.stack(rows), from_model
+
+    @staticmethod
+    def encode_persistent(texts: List[str], namespace: str) -> np.ndarray:
+        """
+        Encode a fixed vocabulary (section keywords, taxonomy skills), reusing
+        an on-disk .npy cache keyed by (model name, texts) when the transformer
+        model is available. The hashing fallback encoder is cheap and is never
+        persisted.
+        """
+        import numpy as np
+
+        if EmbeddingModel._model is None:
+            try:
+                EmbeddingModel.load()
+            except Exception:
+                return EmbeddingModel.encode(texts)
+
+        key_source = f"{EmbeddingModel._model_name}|" + "\n".join(texts)
+        key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+        cache_path = EMBEDDING_CACHE_DIR / f"{namespace}_{key}.npy"
+
+        try:
+            return np.load(cache_path, mmap_mode="r")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            # Truncated or corrupt cache file: drop it and re-encode
+            try:
+                cache_path.unlink()
+            except OSError:
+                pass
+
+        embeddings, from_model = EmbeddingModel._encode(texts)
+        if not from_model:
+            return embeddings  # Never persist fallback vectors under the model's name
+
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.save(f, embeddings)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Cache is best-effort; read-only filesystems just skip it
+        finally:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        return embeddings
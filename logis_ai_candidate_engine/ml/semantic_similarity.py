@@ -1,9 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
-
-import numpy as np
+from typing import List, Optional
 
 from logis_ai_candidate_engine.ml.embedding_model import EmbeddingModel
 
@@ -14,13 +12,27 @@ class SemanticSimilarityResult:
     explanation: str
 
 
+_INSUFFICIENT_TEXT = SemanticSimilarityResult(
+    score=0,
+    explanation="Insufficient text provided for semantic comparison",
+)
+
+
 class SemanticSimilarityScorer:
     @staticmethod
-    def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
-        denom = (float(np.linalg.norm(a)) * float(np.linalg.norm(b)))
-        if denom <= 0:
-            return 0.0
-        return float(np.dot(a, b) / denom)
+    def _combine_job_text(job_text: str, job_profile_text: Optional[str]) -> str:
+        combined_job_text = (job_text or "").strip()
+        if job_profile_text:
+            combined_job_text = f"{combined_job_text}\n{job_profile_text}".strip()
+        return combined_job_text
+
+    @staticmethod
+    def _to_result(sim: float) -> SemanticSimilarityResult:
+        score = int(round(max(0.0, min(1.0, (sim + 1.0) / 2.0)) * 100))
+        return SemanticSimilarityResult(
+            score=score,
+            explanation=f"Semantic similarity score computed as {score}/100",
+        )
 
     @staticmethod
     def score(
@@ -28,25 +40,42 @@ class SemanticSimilarityScorer:
         candidate_text: str,
         job_profile_text: Optional[str] = None,
     ) -> SemanticSimilarityResult:
-        combined_job_text = (job_text or "").strip()
-        if job_profile_text:
-            combined_job_text = f"{combined_job_text}\n{job_profile_text}".strip()
-
+        combined_job_text = SemanticSimilarityScorer._combine_job_text(job_text, job_profile_text)
         combined_candidate_text = (candidate_text or "").strip()
 
         if not combined_job_text or not combined_candidate_text:
-            return SemanticSimilarityResult(
-                score=0,
-                explanation="Insufficient text provided for semantic comparison",
-            )
+            return _INSUFFICIENT_TEXT
 
+        # Embeddings are L2-normalized, so cosine similarity is a plain dot product
         vectors = EmbeddingModel.encode([combined_job_text, combined_candidate_text])
-        a = np.asarray(vectors[0], dtype=np.float32)
-        b = np.asarray(vectors[1], dtype=np.float32)
-        sim = SemanticSimilarityScorer._cosine_similarity(a, b)
-        score = int(round(max(0.0, min(1.0, (sim + 1.0) / 2.0)) * 100))
+        sim = float(vectors[0] @ vectors[1])
+        return SemanticSimilarityScorer._to_result(sim)
 
-        return SemanticSimilarityResult(
-            score=score,
-            explanation=f"Semantic similarity score computed as {score}/100",
+    @staticmethod
+    def score_many(
+        job_text: str,
+        candidate_texts: List[str],
+        job_profile_text: Optional[str] = None,
+    ) -> List[SemanticSimilarityResult]:
+        """
+        Score many candidates against one job with a single encode call
+        and a single matrix-vector product.
+        """
+        combined_job_text = SemanticSimilarityScorer._combine_job_text(job_text, job_profile_text)
+        combined_candidate_texts = [(text or "").strip() for text in candidate_texts]
+
+        if not combined_job_text:
+            return [_INSUFFICIENT_TEXT] * len(candidate_texts)
+
+        present = [i for i, text in enumerate(combined_candidate_texts) if text]
+        results = [_INSUFFICIENT_TEXT] * len(candidate_texts)
+        if not present:
+            return results
+
+        vectors = EmbeddingModel.encode(
+            [combined_job_text] + [combined_candidate_texts[i] for i in present]
         )
+        sims = vectors[1:] @ vectors[0]
+        for i, sim in zip(present, sims):
+            results[i] = SemanticSimilarityScorer._to_result(float(sim))
+        return results
@@ -12,13 +12,21 @@ Author: Senior SDE
 Date: January 2, 2026
 """
 
-from typing import List, Dict, Tuple, Set, Optional
+from typing import TYPE_CHECKING, List, Dict, Tuple, Set, Optional
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations_with_replacement
 import yaml
 import re
 from pathlib import Path
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+from logis_ai_candidate_engine.ml.embedding_model import EmbeddingModel
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily, only needed for type hints
+    from sentence_transformers import SentenceTransformer
+
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s-]')
 
 
 @dataclass
@@ -66,7 +74,7 @@ class SkillMatcher:
     - Special character handling
     """
     
-    def __init__(self, config_path: Optional[str] = None, embedding_model: Optional[SentenceTransformer] = None):
+    def __init__(self, config_path: Optional[str] = None, embedding_model: Optional["SentenceTransformer"] = None):
         """
         Initialize the SkillMatcher with taxonomy and embedding model.
         
@@ -92,9 +100,15 @@ class SkillMatcher:
         # Build reverse lookup maps for fast matching
         self._build_lookup_maps()
         
+        # Memoize per instance: results depend on this matcher's taxonomy/config
+        self._normalize_skill = lru_cache(maxsize=4096)(self._normalize_skill)
+        self._get_canonical_skill = lru_cache(maxsize=4096)(self._get_canonical_skill)
+        
         # Load embedding model for semantic matching
         self.embedding_model = embedding_model
+        # Canonical skill -> unit-length float32 embedding
         self._skill_embeddings_cache: Dict[str, np.ndarray] = {}
+        self._taxonomy_embeddings_loaded = False
         
         # Configuration flags
         self.enable_synonym = self.matching_config.get('enable_synonym_matching', True)
@@ -129,6 +143,13 @@ class SkillMatcher:
                 if skill not in self.skill_to_relationships:
                     self.skill_to_relationships[skill] = []
                 self.skill_to_relationships[skill].append(group_name)
+        
+        # Every (unordered) canonical pair that must never match
+        self._excluded_pairs = frozenset(
+            frozenset(pair)
+            for group in self.exclusions
+            for pair in combinations_with_replacement(group, 2)
+        )
     
     def _normalize_skill(self, skill: str) -> str:
         """Normalize skill name for matching"""
@@ -139,7 +160,7 @@ class SkillMatcher:
         
         # Remove special characters if configured
         if self.matching_config.get('strip_special_chars', True):
-            skill = re.sub(r'[^\w\s-]', '', skill)
+            skill = _SPECIAL_CHARS_RE.sub('', skill)
         
         # Normalize whitespace
         skill = ' '.join(skill.split())
@@ -153,13 +174,15 @@ class SkillMatcher:
     
     def _is_excluded_pair(self, skill1: str, skill2: str) -> bool:
         """Check if two skills are in exclusion list"""
-        canonical1 = self._get_canonical_skill(skill1)
-        canonical2 = self._get_canonical_skill(skill2)
-        
-        for excluded_pair in self.exclusions:
-            if (canonical1 in excluded_pair and canonical2 in excluded_pair):
-                return True
-        return False
+        pair = frozenset((self._get_canonical_skill(skill1), self._get_canonical_skill(skill2)))
+        return pair in self._excluded_pairs
+    
+    @staticmethod
+    def _unit_vector(embedding) -> np.ndarray:
+        """Cached form of an embedding: float32, L2-normalized (zero stays zero)"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else np.zeros_like(vector)
     
     def _get_skill_embedding(self, skill: str) -> Optional[np.ndarray]:
         """Get embedding for a skill (with caching)"""
@@ -171,10 +194,55 @@ class SkillMatcher:
         if canonical not in self._skill_embeddings_cache:
             # Generate embedding
             embedding = self.embedding_model.encode([canonical])[0]
-            self._skill_embeddings_cache[canonical] = embedding
+            self._skill_embeddings_cache[canonical] = self._unit_vector(embedding)
         
         return self._skill_embeddings_cache[canonical]
     
+    def _prefetch_skill_embeddings(self, skills: List[str]) -> None:
+        """Encode every uncached skill in one batched call instead of one call per skill"""
+        if self.embedding_model is None or not self.enable_semantic:
+            return
+        
+        if not self._taxonomy_embeddings_loaded:
+            self._taxonomy_embeddings_loaded = True
+            self._load_taxonomy_embeddings()
+        
+        missing = list(dict.fromkeys(
+            canonical for canonical in map(self._get_canonical_skill, skills)
+            if canonical not in self._skill_embeddings_cache
+        ))
+        if not missing:
+            return
+        
+        embeddings = self.embedding_model.encode(missing)
+        for canonical, embedding in zip(missing, embeddings):
+            self._skill_embeddings_cache[canonical] = self._unit_vector(embedding)
+    
+    def _load_taxonomy_embeddings(self) -> None:
+        """
+        Seed the cache with every canonical taxonomy skill. With the shared
+        EmbeddingModel the vectors come from its on-disk cache, so later runs
+        load them instead of re-encoding; other encoders are left to the
+        per-call batches.
+        """
+        model = self.embedding_model
+        if not (model is EmbeddingModel or isinstance(model, EmbeddingModel)):
+            return
+        
+        terms = set(self.synonyms) | set(self.skill_to_category)
+        for synonyms_list in self.synonyms.values():
+            terms.update(synonyms_list)
+        canonical_skills = sorted({self._get_canonical_skill(term) for term in terms} - {""})
+        if not canonical_skills:
+            return
+        
+        try:
+            embeddings = EmbeddingModel.encode_persistent(canonical_skills, "skillemb")
+        except Exception:
+            return  # Fall back to encoding skills as they are seen
+        for canonical, embedding in zip(canonical_skills, embeddings):
+            self._skill_embeddings_cache[canonical] = self._unit_vector(embedding)
+    
     def _calculate_semantic_similarity(self, skill1: str, skill2: str) -> float:
         """Calculate semantic similarity between two skills using embeddings"""
         if not self.enable_semantic or self.embedding_model is None:
@@ -190,19 +258,87 @@ class SkillMatcher:
         if emb1 is None or emb2 is None:
             return 0.0
         
-        # Cosine similarity
-        similarity = np.dot(emb1, emb2) / (np.linalg.norm(emb1) * np.linalg.norm(emb2))
-        return float(similarity)
+        # Cosine similarity (cached embeddings are already unit length)
+        return float(np.dot(emb1, emb2))
+    
+    def _semantic_similarity_matrix(
+        self,
+        job_skills: List[str],
+        candidate_skills: List[str]
+    ) -> Optional[np.ndarray]:
+        """
+        Cosine similarity of every job skill against every candidate skill,
+        computed as one matrix product over the cached unit-length embeddings.
+        Exclusions are not applied here; callers check them per pair.
+        """
+        if not self.enable_semantic or self.embedding_model is None:
+            return None
+        if not job_skills or not candidate_skills:
+            return None
+        
+        job_matrix = np.stack([self._get_skill_embedding(skill) for skill in job_skills])
+        candidate_matrix = np.stack([self._get_skill_embedding(skill) for skill in candidate_skills])
+        return job_matrix @ candidate_matrix.T
+    
+    def _exact_match(
+        self,
+        job_skill: str,
+        candidate_by_normalized: Dict[str, str],
+        is_required: bool
+    ) -> Optional[SkillMatch]:
+        """Return an exact match for job_skill, or None (no embeddings needed)."""
+        candidate_skill = candidate_by_normalized.get(self._normalize_skill(job_skill))
+        if candidate_skill is None:
+            return None
+        return SkillMatch(
+            job_skill=job_skill,
+            candidate_skill=candidate_skill,
+            match_type='exact',
+            confidence=1.0,
+            weight=self.weights['match_type_weights']['exact_match'],
+            is_required=is_required,
+            category=self.skill_to_category.get(self._get_canonical_skill(job_skill))
+        )
+    
+    def _synonym_match(
+        self,
+        job_skill: str,
+        candidate_by_canonical: Dict[str, str],
+        is_required: bool
+    ) -> Optional[SkillMatch]:
+        """
+        Return a synonym match for job_skill, or None. Only valid once exact
+        matching has failed; a synonym (0.95) outranks any semantic or category match.
+        """
+        if not self.enable_synonym:
+            return None
+        job_canonical = self._get_canonical_skill(job_skill)
+        candidate_skill = candidate_by_canonical.get(job_canonical)
+        if candidate_skill is None:
+            return None
+        return SkillMatch(
+            job_skill=job_skill,
+            candidate_skill=candidate_skill,
+            match_type='synonym',
+            confidence=0.95,
+            weight=self.weights['match_type_weights']['synonym_match'],
+            is_required=is_required,
+            category=self.skill_to_category.get(job_canonical)
+        )
     
     def _match_single_skill(
         self, 
         job_skill: str, 
         candidate_skills: List[str],
-        is_required: bool = True
+        is_required: bool = True,
+        semantic_row: Optional[np.ndarray] = None
     ) -> Optional[SkillMatch]:
         """
         Match a single job skill against candidate skills using multiple strategies.
         
+        ``semantic_row`` holds precomputed similarities of this job skill to
+        each candidate skill (see _semantic_similarity_matrix).
+        
         Returns the best match or None if no match found.
         """
         job_normalized = self._normalize_skill(job_skill)
@@ -210,7 +346,7 @@ class SkillMatcher:
         best_match: Optional[SkillMatch] = None
         best_confidence = 0.0
         
-        for candidate_skill in candidate_skills:
+        for index, candidate_skill in enumerate(candidate_skills):
             candidate_normalized = self._normalize_skill(candidate_skill)
             candidate_canonical = self._get_canonical_skill(candidate_skill)
             
@@ -246,7 +382,12 @@ class SkillMatcher:
             
             # Strategy 3: Semantic Match (using embeddings)
             if self.enable_semantic:
-                semantic_sim = self._calculate_semantic_similarity(job_skill, candidate_skill)
+                if semantic_row is None:
+                    semantic_sim = self._calculate_semantic_similarity(job_skill, candidate_skill)
+                elif self._is_excluded_pair(job_skill, candidate_skill):
+                    semantic_sim = 0.0
+                else:
+                    semantic_sim = float(semantic_row[index])
                 if semantic_sim >= self.semantic_threshold:
                     confidence = semantic_sim * 0.85  # Scale to 0.85 max
                     if confidence > best_confidence:
@@ -305,18 +446,46 @@ class SkillMatcher:
         missing_required: List[str] = []
         missing_preferred: List[str] = []
         
-        # Match required skills
-        for job_skill in required_job_skills:
-            match = self._match_single_skill(job_skill, candidate_skills, is_required=True)
-            if match:
-                matched_required.append(match)
-            else:
-                missing_required.append(job_skill)
+        job_skills = [(skill, True) for skill in required_job_skills] + [
+            (skill, False) for skill in preferred_job_skills
+        ]
+        
+        # Exact and synonym matches are dict lookups needing no embeddings;
+        # resolve them first
+        candidate_by_normalized: Dict[str, str] = {}
+        candidate_by_canonical: Dict[str, str] = {}
+        for candidate_skill in candidate_skills:
+            candidate_by_normalized.setdefault(self._normalize_skill(candidate_skill), candidate_skill)
+            candidate_by_canonical.setdefault(self._get_canonical_skill(candidate_skill), candidate_skill)
+        matches: List[Optional[SkillMatch]] = [
+            self._exact_match(job_skill, candidate_by_normalized, is_required)
+            or self._synonym_match(job_skill, candidate_by_canonical, is_required)
+            for job_skill, is_required in job_skills
+        ]
+        
+        # Embed only the still-unmatched job skills (plus candidate skills) in a
+        # single batch, and build one similarity table for those rows
+        pending = [i for i, match in enumerate(matches) if match is None]
+        if pending:
+            pending_skills = [job_skills[i][0] for i in pending]
+            self._prefetch_skill_embeddings(pending_skills + list(candidate_skills))
+            similarities = self._semantic_similarity_matrix(pending_skills, candidate_skills)
+            for row, i in enumerate(pending):
+                job_skill, is_required = job_skills[i]
+                matches[i] = self._match_single_skill(
+                    job_skill,
+                    candidate_skills,
+                    is_required=is_required,
+                    semantic_row=similarities[row] if similarities is not None else None,
+                )
         
-        # Match preferred skills
-        for job_skill in preferred_job_skills:
-            match = self._match_single_skill(job_skill, candidate_skills, is_required=False)
-            if match:
+        for (job_skill, is_required), match in zip(job_skills, matches):
+            if is_required:
+                if match:
+                    matched_required.append(match)
+                else:
+                    missing_required.append(job_skill)
+            elif match:
                 matched_preferred.append(match)
             else:
                 missing_preferred.append(job_skill)
@@ -438,7 +607,7 @@ class SkillMatcher:
 _skill_matcher_instance: Optional[SkillMatcher] = None
 
 
-def get_skill_matcher(embedding_model: Optional[SentenceTransformer] = None) -> SkillMatcher:
+def get_skill_matcher(embedding_model: Optional["SentenceTransformer"] = None) -> SkillMatcher:
     """Get or create singleton SkillMatcher instance"""
     global _skill_matcher_instance
     
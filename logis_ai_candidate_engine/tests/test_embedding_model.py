@@ -0,0 +1,70 @@
+# Unit tests for the embedding caches (in-memory LRU and on-disk .npy)
+
+import numpy as np
+import pytest
+
+from logis_ai_candidate_engine.ml import embedding_model
+from logis_ai_candidate_engine.ml.embedding_model import EmbeddingModel
+
+
+class _FailingModel:
+    """Stands in for a loaded transformer whose encode call fails (e.g. CUDA OOM)"""
+
+    device = None
+
+    def encode(self, *args, **kwargs):
+        raise RuntimeError("transient failure")
+
+
+@pytest.fixture
+def failing_model(monkeypatch, tmp_path):
+    monkeypatch.setattr(EmbeddingModel, "_model", _FailingModel())
+    monkeypatch.setattr(EmbeddingModel, "_model_name", "real-model")
+    monkeypatch.setattr(EmbeddingModel, "_cache", type(EmbeddingModel._cache)())
+    monkeypatch.setattr(embedding_model, "EMBEDDING_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(EmbeddingModel, "load", staticmethod(lambda *a, **k: EmbeddingModel._model))
+    return tmp_path
+
+
+def test_fallback_rows_are_not_cached_under_model_backend(failing_model):
+    EmbeddingModel.encode(["python developer"])
+
+    assert EmbeddingModel._cache
+    assert all(backend == "fallback" for backend, _ in EmbeddingModel._cache)
+
+
+def test_fallback_vectors_are_not_persisted(failing_model):
+    EmbeddingModel.encode_persistent(["skills", "education"], "sectionemb")
+
+    assert list(failing_model.iterdir()) == []
+
+
+def test_corrupt_persistent_cache_is_discarded(failing_model, monkeypatch):
+    class _WorkingModel(_FailingModel):
+        def encode(self, texts, **kwargs):
+            return np.ones((len(texts), 4), dtype=np.float32)
+
+    monkeypatch.setattr(EmbeddingModel, "_model", _WorkingModel())
+    EmbeddingModel.encode_persistent(["skills"], "sectionemb")
+    (cache_file,) = failing_model.iterdir()
+    cache_file.write_bytes(b"")  # Truncated to nothing: np.load raises EOFError
+
+    embeddings = EmbeddingModel.encode_persistent(["skills"], "sectionemb")
+
+    assert embeddings.shape == (1, 4)
+    assert [p.name for p in failing_model.iterdir()] == [cache_file.name]
+
+
+def test_cached_model_rows_are_not_mixed_with_fallback_rows(failing_model, monkeypatch):
+    class _WorkingModel(_FailingModel):
+        def encode(self, texts, **kwargs):
+            return np.ones((len(texts), 4), dtype=np.float32) / 2
+
+    monkeypatch.setattr(EmbeddingModel, "_model", _WorkingModel())
+    EmbeddingModel.encode(["python developer"])  # Warm the cache with model vectors
+    monkeypatch.setattr(EmbeddingModel, "_model", _FailingModel())
+
+    texts = ["python developer", "java developer"]
+    embeddings = EmbeddingModel.encode(texts)
+
+    np.testing.assert_array_equal(embeddings, EmbeddingModel._fallback_encode(texts))
@@ -4,10 +4,16 @@ Enterprise-grade test suite for contextual adjustments, confidence scoring,
 feature interactions, and smart weight optimization.
 """
 
+import hashlib
+
+import numpy as np
 import pytest
 from logis_ai_candidate_engine.core.schemas.job import Job
-from logis_ai_candidate_engine.core.schemas.candidate import Candidate
-from logis_ai_candidate_engine.core.scoring.contextual_adjuster import ContextualAdjuster
+from logis_ai_candidate_engine.core.schemas.candidate import Candidate, EmploymentHistory
+from logis_ai_candidate_engine.core.scoring.contextual_adjuster import (
+    ContextualAdjuster,
+    clip_scores,
+)
 from logis_ai_candidate_engine.core.scoring.confidence_calculator import (
     ConfidenceCalculator,
     ConfidenceLevel,
@@ -19,6 +25,7 @@ from logis_ai_candidate_engine.core.scoring.advanced_scorer import (
 from logis_ai_candidate_engine.core.scoring.skills_scorer import SkillsScorer
 from logis_ai_candidate_engine.core.scoring.experience_scorer import ExperienceScorer
 from logis_ai_candidate_engine.ml.embedding_model import EmbeddingModel
+from logis_ai_candidate_engine.ml.skill_matcher import SkillMatcher
 
 
 # ============================================================================
@@ -26,10 +33,82 @@ from logis_ai_candidate_engine.ml.embedding_model import EmbeddingModel
 # ============================================================================
 
 
-@pytest.fixture
+class FakeEmbedder:
+    """
+    Deterministic stand-in for the sentence transformer: each text hashes to
+    a fixed random unit vector, so only exact/synonym matches ever succeed.
+    """
+
+    DIM = 384
+
+    def encode(self, texts, **kwargs):
+        rows = [
+            np.random.default_rng(
+                int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+            ).standard_normal(self.DIM, dtype=np.float32)
+            for text in texts
+        ]
+        vectors = np.stack(rows) if rows else np.empty((0, self.DIM), dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture(scope="session")
 def embedding_model():
-    """Shared embedding model for skill scoring."""
-    return EmbeddingModel()
+    """Real embedding model, loaded and warmed once per session (``slow`` tests only)."""
+    model = EmbeddingModel()
+    warmup = model.encode(["warmup"])  # pay model load / lazy backend init up front
+    # Similarity math stays in float32 (sgemm, half the bandwidth of float64)
+    assert warmup.dtype == np.float32
+    return model
+
+
+@pytest.fixture(scope="session")
+def fake_embedder():
+    """Hash-based embedder for tests that must not depend on semantic similarity."""
+    return FakeEmbedder()
+
+
+def _make_skills_scorer(embedding_model) -> SkillsScorer:
+    """SkillsScorer on its own SkillMatcher (get_skill_matcher keeps the first model it sees)."""
+    scorer = SkillsScorer(embedding_model=embedding_model)
+    scorer.skill_matcher = SkillMatcher(embedding_model=embedding_model)
+    return scorer
+
+
+@pytest.fixture(scope="session")
+def adjuster():
+    """Contextual adjuster with its rule table loaded once per session."""
+    return ContextualAdjuster()
+
+
+@pytest.fixture(scope="session")
+def skills_scorer(fake_embedder):
+    return _make_skills_scorer(fake_embedder)
+
+
+@pytest.fixture(scope="session")
+def semantic_skills_scorer(embedding_model):
+    return _make_skills_scorer(embedding_model)
+
+
+@pytest.fixture(scope="session")
+def exp_scorer():
+    return ExperienceScorer()
+
+
+@pytest.fixture(scope="session")
+def confidence_calc():
+    return ConfidenceCalculator()
+
+
+@pytest.fixture(scope="session")
+def interaction_detector():
+    return FeatureInteractionDetector()
+
+
+@pytest.fixture(scope="session")
+def weight_optimizer():
+    return SmartWeightOptimizer()
 
 
 @pytest.fixture
@@ -227,149 +306,132 @@ def perfect_match_candidate():
 # ============================================================================
 
 
-def test_gcc_experience_major_bonus(gcc_job, gcc_veteran_candidate, embedding_model):
-    """Test GCC experience major bonus for 8 years GCC experience."""
-    adjuster = ContextualAdjuster()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
-    skills_result = skills_scorer.score(
-        gcc_job.required_skills, gcc_veteran_candidate.skills, gcc_job.preferred_skills
-    )
-    exp_result = exp_scorer.score(
-        gcc_job.min_experience_years,
-        gcc_job.max_experience_years,
-        gcc_veteran_candidate.total_experience_years,
-    )
+class ScoringHarness:
+    """Scores (job, candidate) pairs once and replays the results across tests."""
+
+    def __init__(self, skills_scorer, exp_scorer):
+        self.skills_scorer = skills_scorer
+        self.exp_scorer = exp_scorer
+        self._results = {}
+
+    def score(self, job, candidate):
+        key = (job.id, candidate.id)
+        if key not in self._results:
+            self._results[key] = (
+                self.skills_scorer.score(
+                    job.required_skills, candidate.skills, job.preferred_skills
+                ),
+                self.exp_scorer.score(
+                    job.min_experience_years,
+                    job.max_experience_years,
+                    candidate.total_experience_years,
+                ),
+            )
+        return self._results[key]
+
+
+@pytest.fixture(scope="session")
+def scoring_harness(skills_scorer, exp_scorer):
+    """Session-wide memo of skills/experience results per (job, candidate)."""
+    return ScoringHarness(skills_scorer, exp_scorer)
+
+
+@pytest.fixture(scope="session")
+def semantic_scoring_harness(semantic_skills_scorer, exp_scorer):
+    """Like scoring_harness, but skills are scored with the real embedding model."""
+    return ScoringHarness(semantic_skills_scorer, exp_scorer)
+
+
+@pytest.mark.parametrize(
+    "harness_fixture,candidate_fixture,base_score,rule_code,impact,expected_adjusted,lowers_score,reason_fragment",
+    [
+        # GCC experience major bonus for 8 years GCC experience
+        pytest.param(
+            "semantic_scoring_harness", "gcc_veteran_candidate", 75, "GCC_EXP_MAJOR_BONUS", 8, 83, False, None,
+            marks=pytest.mark.slow,
+        ),
+        # Perfect skills match bonus
+        ("scoring_harness", "perfect_match_candidate", 85, "PERFECT_SKILLS", 5, None, False, None),
+        # Severely overqualified candidate penalty
+        pytest.param(
+            "semantic_scoring_harness", "overqualified_candidate", 78, "SEVERE_OVERQUALIFIED", -5, None, True, None,
+            marks=pytest.mark.slow,
+        ),
+        # Job hopping penalty (5 jobs in 6 years)
+        pytest.param(
+            "semantic_scoring_harness", "job_hopper_candidate", 70, "JOB_HOPPING", -4, None, False, "5 jobs in 6.0 years",
+            marks=pytest.mark.slow,
+        ),
+        # Expected salary (145k) is within sweet spot (125k-150k for 100k-150k range)
+        pytest.param(
+            "semantic_scoring_harness", "gcc_veteran_candidate", 80, "SALARY_SWEET_SPOT", 3, None, False, None,
+            marks=pytest.mark.slow,
+        ),
+    ],
+    ids=["gcc_major_bonus", "perfect_skills", "severe_overqualified", "job_hopping", "salary_sweet_spot"],
+)
+def test_contextual_adjustment_rule(
+    request,
+    gcc_job,
+    adjuster,
+    harness_fixture,
+    candidate_fixture,
+    base_score,
+    rule_code,
+    impact,
+    expected_adjusted,
+    lowers_score,
+    reason_fragment,
+):
+    """Test each single-rule bonus/penalty fires once with its expected impact."""
+    candidate = request.getfixturevalue(candidate_fixture)
+    skills_result, exp_result = request.getfixturevalue(harness_fixture).score(gcc_job, candidate)
 
-    base_score = 75
     adjusted, adjustments = adjuster.apply_adjustments(
-        base_score, gcc_job, gcc_veteran_candidate, skills_result, exp_result
+        base_score, gcc_job, candidate, skills_result, exp_result
     )
 
-    # Should get GCC_EXP_MAJOR_BONUS (+8)
-    gcc_bonus = [a for a in adjustments if a.rule_code == "GCC_EXP_MAJOR_BONUS"]
-    assert len(gcc_bonus) == 1
-    assert gcc_bonus[0].impact == 8
-    assert adjusted == 83
+    # Each rule fires at most once, so index the applied adjustments by code
+    by_code = {a.rule_code: a for a in adjustments}
+    assert len(by_code) == len(adjustments)
+    assert by_code[rule_code].impact == impact
+    if lowers_score:
+        assert adjusted < base_score
+    if expected_adjusted is not None:
+        assert adjusted == expected_adjusted
+    if reason_fragment is not None:
+        assert reason_fragment in by_code[rule_code].reason
 
 
-def test_perfect_skills_bonus(gcc_job, perfect_match_candidate, embedding_model):
-    """Test perfect skills match bonus."""
-    adjuster = ContextualAdjuster()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
+def test_perfect_match_has_no_missing_skills(gcc_job, perfect_match_candidate, scoring_harness):
+    """Perfect match should have 100% required + 100% preferred."""
+    skills_result, _ = scoring_harness.score(gcc_job, perfect_match_candidate)
 
-    skills_result = skills_scorer.score(
-        gcc_job.required_skills, perfect_match_candidate.skills, gcc_job.preferred_skills
-    )
-    exp_result = exp_scorer.score(
-        gcc_job.min_experience_years,
-        gcc_job.max_experience_years,
-        perfect_match_candidate.total_experience_years,
-    )
-
-    # Perfect match should have 100% required + 100% preferred
     assert len(skills_result.missing_required) == 0
     assert len(skills_result.missing_preferred) == 0
 
-    base_score = 85
-    adjusted, adjustments = adjuster.apply_adjustments(
-        base_score, gcc_job, perfect_match_candidate, skills_result, exp_result
-    )
-
-    # Should get PERFECT_SKILLS bonus (+5)
-    perfect_bonus = [a for a in adjustments if a.rule_code == "PERFECT_SKILLS"]
-    assert len(perfect_bonus) == 1
-    assert perfect_bonus[0].impact == 5
-
-
-def test_severe_overqualified_penalty(gcc_job, overqualified_candidate, embedding_model):
-    """Test penalty for severely overqualified candidate."""
-    adjuster = ContextualAdjuster()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
-    skills_result = skills_scorer.score(
-        gcc_job.required_skills, overqualified_candidate.skills, gcc_job.preferred_skills
-    )
-    exp_result = exp_scorer.score(
-        gcc_job.min_experience_years,
-        gcc_job.max_experience_years,
-        overqualified_candidate.total_experience_years,
-    )
 
-    base_score = 78
-    adjusted, adjustments = adjuster.apply_adjustments(
-        base_score, gcc_job, overqualified_candidate, skills_result, exp_result
-    )
+def test_exact_skill_matches_skip_embeddings(skills_scorer, fake_embedder, monkeypatch):
+    """Job skills that all match exactly should never reach the embedding model."""
 
-    # Should get SEVERE_OVERQUALIFIED penalty (-5)
-    overqualified_penalty = [a for a in adjustments if a.rule_code == "SEVERE_OVERQUALIFIED"]
-    assert len(overqualified_penalty) == 1
-    assert overqualified_penalty[0].impact == -5
-    assert adjusted < base_score
+    def fail(*args, **kwargs):
+        raise AssertionError("exact matches should not be embedded")
 
+    monkeypatch.setattr(type(fake_embedder), "encode", staticmethod(fail))
+    result = skills_scorer.score(["Python", "SQL"], ["sql", "python", "Excel"], ["Excel"])
 
-def test_job_hopping_penalty(gcc_job, job_hopper_candidate, embedding_model):
-    """Test penalty for job hopping (5 jobs in 6 years)."""
-    adjuster = ContextualAdjuster()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
+    assert result.exact_matches == 3
+    assert result.missing_required == []
 
-    skills_result = skills_scorer.score(
-        gcc_job.required_skills, job_hopper_candidate.skills, gcc_job.preferred_skills
-    )
-    exp_result = exp_scorer.score(
-        gcc_job.min_experience_years,
-        gcc_job.max_experience_years,
-        job_hopper_candidate.total_experience_years,
-    )
 
-    base_score = 70
-    adjusted, adjustments = adjuster.apply_adjustments(
-        base_score, gcc_job, job_hopper_candidate, skills_result, exp_result
-    )
-
-    # Should get JOB_HOPPING penalty (-4)
-    hopping_penalty = [a for a in adjustments if a.rule_code == "JOB_HOPPING"]
-    assert len(hopping_penalty) == 1
-    assert hopping_penalty[0].impact == -4
-    assert "5 jobs in 6.0 years" in hopping_penalty[0].reason
-
-
-def test_salary_sweet_spot_bonus(gcc_job, gcc_veteran_candidate, embedding_model):
-    """Test salary sweet spot bonus."""
-    adjuster = ContextualAdjuster()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
-    skills_result = skills_scorer.score(
-        gcc_job.required_skills, gcc_veteran_candidate.skills, gcc_job.preferred_skills
-    )
-    exp_result = exp_scorer.score(
-        gcc_job.min_experience_years,
-        gcc_job.max_experience_years,
-        gcc_veteran_candidate.total_experience_years,
-    )
-
-    base_score = 80
-    adjusted, adjustments = adjuster.apply_adjustments(
-        base_score, gcc_job, gcc_veteran_candidate, skills_result, exp_result
-    )
-
-    # Expected salary (145k) is within sweet spot (125k-150k for 100k-150k range)
-    sweet_spot = [a for a in adjustments if a.rule_code == "SALARY_SWEET_SPOT"]
-    assert len(sweet_spot) == 1
-    assert sweet_spot[0].impact == 3
-
-
-def test_cumulative_adjustments(gcc_job, perfect_match_candidate, embedding_model):
+def test_cumulative_adjustments(
+    gcc_job,
+    perfect_match_candidate,
+    adjuster,
+    skills_scorer,
+    exp_scorer,
+):
     """Test multiple adjustments applied cumulatively."""
-    adjuster = ContextualAdjuster()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
     skills_result = skills_scorer.score(
         gcc_job.required_skills, perfect_match_candidate.skills, gcc_job.preferred_skills
     )
@@ -389,8 +451,98 @@ def test_cumulative_adjustments(gcc_job, perfect_match_candidate, embedding_mode
     assert adjusted > base_score
     
     # Calculate total delta
-    total_delta = sum(a.impact for a in adjustments)
-    assert adjusted == min(100, base_score + total_delta)  # Capped at 100
+    impacts = np.fromiter((a.impact for a in adjustments), dtype=np.float64, count=len(adjustments))
+    np.testing.assert_allclose(adjusted, min(100, base_score + impacts.sum()))  # Capped at 100
+
+
+def test_clip_scores_caps_to_score_range():
+    """Test batched adjustment totals are clamped into 0-100."""
+    adjusted = clip_scores([95, 5, 50], [10, -10, 3.5])
+
+    np.testing.assert_allclose(adjusted, [100, 0, 53.5])
+
+
+def _batch_job() -> Job:
+    return Job(
+        job_id="job-batch",
+        country="UAE",
+        title="Supply Chain Manager",
+        industry="Logistics",
+        functional_area="Operations",
+        designation="Manager",
+        min_experience_years=5,
+        max_experience_years=10,
+        salary_min=100000,
+        salary_max=150000,
+        currency="AED",
+        required_skills=["Supply Chain", "SAP"],
+        job_description="Regional supply chain role",
+    )
+
+
+# Candidate profiles for the batch tests, each tripping different rules
+_BATCH_PROFILES = {
+    "gcc_veteran": {"gcc_experience_years": 8, "expected_salary": 145000},
+    "overqualified": {"total_experience_years": 20, "gcc_experience_years": 0},
+    "job_hopper": {
+        "employment_history": [
+            EmploymentHistory(company_name=f"Co{i}", job_title="Coordinator", duration_months=14)
+            for i in range(5)
+        ],
+    },
+    "partial_skills": {"skills": ["Supply Chain"], "expected_salary": 160000},
+}
+
+
+def _batch_candidate(profile: str) -> Candidate:
+    return Candidate(
+        **{
+            "candidate_id": f"cand-{profile}",
+            "nationality": "Indian",
+            "current_country": "UAE",
+            "currency": "AED",
+            "expected_salary": 130000,
+            "total_experience_years": 7,
+            "skills": ["Supply Chain", "SAP"],
+            **_BATCH_PROFILES[profile],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "profiles,base_scores",
+    [
+        ([], []),
+        (["gcc_veteran"], [75]),
+        (["job_hopper", "overqualified"], [70, 3]),
+        (list(_BATCH_PROFILES), [98, 60, 70, 45]),
+    ],
+    ids=["empty", "single", "penalties", "all_profiles"],
+)
+def test_apply_adjustments_batch_matches_per_candidate(adjuster, profiles, base_scores):
+    """Batch adjustments equal apply_adjustments run candidate by candidate."""
+    job = _batch_job()
+    candidates = [_batch_candidate(profile) for profile in profiles]
+    section_scores = [{"skills": 80, "experience": 75, "semantic": 70} for _ in candidates]
+
+    batch = adjuster.apply_adjustments_batch(base_scores, job, candidates, section_scores)
+    single = [
+        adjuster.apply_adjustments(base_score, job, candidate, scores)
+        for base_score, candidate, scores in zip(base_scores, candidates, section_scores)
+    ]
+
+    assert [score for score, _ in batch] == [score for score, _ in single]
+    assert [[a.rule_code for a in adjustments] for _, adjustments in batch] == [
+        [a.rule_code for a in adjustments] for _, adjustments in single
+    ]
+
+
+def test_apply_adjustments_batch_rejects_mismatched_lengths(adjuster):
+    """Rows are never silently dropped when the per-candidate lists disagree."""
+    candidates = [_batch_candidate("gcc_veteran"), _batch_candidate("overqualified")]
+
+    with pytest.raises(ValueError):
+        adjuster.apply_adjustments_batch([75], _batch_job(), candidates, [{}, {}])
 
 
 # ============================================================================
@@ -398,13 +550,16 @@ def test_cumulative_adjustments(gcc_job, perfect_match_candidate, embedding_mode
 # ============================================================================
 
 
-def test_confidence_very_high_complete_data(gcc_job, gcc_veteran_candidate, embedding_model):
+@pytest.mark.slow
+def test_confidence_very_high_complete_data(
+    gcc_job,
+    gcc_veteran_candidate,
+    confidence_calc,
+    semantic_skills_scorer,
+    exp_scorer,
+):
     """Test very high confidence for complete, consistent data."""
-    calculator = ConfidenceCalculator()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
-    skills_result = skills_scorer.score(
+    skills_result = semantic_skills_scorer.score(
         gcc_job.required_skills, gcc_veteran_candidate.skills, gcc_job.preferred_skills
     )
     exp_result = exp_scorer.score(
@@ -416,7 +571,7 @@ def test_confidence_very_high_complete_data(gcc_job, gcc_veteran_candidate, embe
     section_scores = {"skills": 90, "experience": 85, "semantic": 88}
     adjusted_score = 88
 
-    confidence = calculator.calculate_confidence(
+    confidence = confidence_calc.calculate_confidence(
         gcc_veteran_candidate, skills_result, exp_result, section_scores, adjusted_score
     )
 
@@ -426,12 +581,9 @@ def test_confidence_very_high_complete_data(gcc_job, gcc_veteran_candidate, embe
     assert len(confidence.uncertainty_factors) <= 2
 
 
-def test_confidence_low_incomplete_data(gcc_job, embedding_model):
+@pytest.mark.slow
+def test_confidence_low_incomplete_data(gcc_job, confidence_calc, semantic_skills_scorer, exp_scorer):
     """Test low confidence for incomplete candidate data."""
-    calculator = ConfidenceCalculator()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
     # Incomplete candidate (missing salary, location, job history)
     incomplete_candidate = Candidate(
         id="cand-incomplete",
@@ -445,7 +597,7 @@ def test_confidence_low_incomplete_data(gcc_job, embedding_model):
         job_history=None,
     )
 
-    skills_result = skills_scorer.score(
+    skills_result = semantic_skills_scorer.score(
         gcc_job.required_skills, incomplete_candidate.skills, gcc_job.preferred_skills
     )
     exp_result = exp_scorer.score(
@@ -455,7 +607,7 @@ def test_confidence_low_incomplete_data(gcc_job, embedding_model):
     section_scores = {"skills": 45, "experience": 70, "semantic": 50}
     adjusted_score = 55
 
-    confidence = calculator.calculate_confidence(
+    confidence = confidence_calc.calculate_confidence(
         incomplete_candidate, skills_result, exp_result, section_scores, adjusted_score
     )
 
@@ -464,12 +616,9 @@ def test_confidence_low_incomplete_data(gcc_job, embedding_model):
     assert "incomplete_profile" in confidence.uncertainty_factors or "weak_signals" in confidence.uncertainty_factors
 
 
-def test_confidence_signal_disagreement(gcc_job, embedding_model):
+@pytest.mark.slow
+def test_confidence_signal_disagreement(gcc_job, confidence_calc, semantic_skills_scorer, exp_scorer):
     """Test lower confidence when signals disagree."""
-    calculator = ConfidenceCalculator()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
     # Candidate with conflicting signals (high exp, low skills)
     conflicting_candidate = Candidate(
         id="cand-conflict",
@@ -483,7 +632,7 @@ def test_confidence_signal_disagreement(gcc_job, embedding_model):
         job_history=[{"title": "Manager", "company": "Co1", "years": 8, "location": "Dubai"}],
     )
 
-    skills_result = skills_scorer.score(
+    skills_result = semantic_skills_scorer.score(
         gcc_job.required_skills, conflicting_candidate.skills, gcc_job.preferred_skills
     )
     exp_result = exp_scorer.score(
@@ -494,7 +643,7 @@ def test_confidence_signal_disagreement(gcc_job, embedding_model):
     section_scores = {"skills": 30, "experience": 90, "semantic": 45}
     adjusted_score = 55
 
-    confidence = calculator.calculate_confidence(
+    confidence = confidence_calc.calculate_confidence(
         conflicting_candidate, skills_result, exp_result, section_scores, adjusted_score
     )
 
@@ -508,12 +657,8 @@ def test_confidence_signal_disagreement(gcc_job, embedding_model):
 # ============================================================================
 
 
-def test_interaction_skills_comp_exp(gcc_job, embedding_model):
+def test_interaction_skills_comp_exp(gcc_job, interaction_detector, skills_scorer, exp_scorer):
     """Test SKILLS_COMP_EXP interaction (high skills compensate for low exp)."""
-    detector = FeatureInteractionDetector()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
     # Junior candidate with excellent skills
     junior_expert = Candidate(
         id="cand-junior-expert",
@@ -542,21 +687,19 @@ def test_interaction_skills_comp_exp(gcc_job, embedding_model):
         gcc_job.min_experience_years, gcc_job.max_experience_years, junior_expert.total_experience_years
     )
 
-    interactions = detector.detect_interactions(gcc_job, junior_expert, skills_result, exp_result, 75)
+    interactions = interaction_detector.detect_interactions(gcc_job, junior_expert, skills_result, exp_result, 75)
 
     # Should detect SKILLS_COMP_EXP
-    skills_comp = [i for i in interactions if i.interaction_type == "SKILLS_COMP_EXP"]
-    assert len(skills_comp) == 1
-    assert skills_comp[0].impact > 0
-    assert "high skills" in skills_comp[0].description.lower()
+    by_type = {i.interaction_type: i for i in interactions}
+    assert len(by_type) == len(interactions)
+    assert "SKILLS_COMP_EXP" in by_type
+    assert by_type["SKILLS_COMP_EXP"].impact > 0
+    assert "high skills" in by_type["SKILLS_COMP_EXP"].description.lower()
 
 
-def test_interaction_exp_comp_skills(gcc_job, embedding_model):
+@pytest.mark.slow
+def test_interaction_exp_comp_skills(gcc_job, interaction_detector, semantic_skills_scorer, exp_scorer):
     """Test EXP_COMP_SKILLS interaction (high exp compensates for skill gaps)."""
-    detector = FeatureInteractionDetector()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
     # Senior candidate with fewer listed skills
     senior_basic = Candidate(
         id="cand-senior-basic",
@@ -570,27 +713,30 @@ def test_interaction_exp_comp_skills(gcc_job, embedding_model):
         job_history=[{"title": "SC Director", "company": "Co1", "years": 12, "location": "Dubai"}],
     )
 
-    skills_result = skills_scorer.score(
+    skills_result = semantic_skills_scorer.score(
         gcc_job.required_skills, senior_basic.skills, gcc_job.preferred_skills
     )
     exp_result = exp_scorer.score(
         gcc_job.min_experience_years, gcc_job.max_experience_years, senior_basic.total_experience_years
     )
 
-    interactions = detector.detect_interactions(gcc_job, senior_basic, skills_result, exp_result, 72)
+    interactions = interaction_detector.detect_interactions(gcc_job, senior_basic, skills_result, exp_result, 72)
 
     # Should detect EXP_COMP_SKILLS
-    exp_comp = [i for i in interactions if i.interaction_type == "EXP_COMP_SKILLS"]
-    assert len(exp_comp) == 1
-    assert exp_comp[0].impact > 0
-
-
-def test_interaction_perfect_candidate_amp(gcc_job, perfect_match_candidate, embedding_model):
+    by_type = {i.interaction_type: i for i in interactions}
+    assert len(by_type) == len(interactions)
+    assert "EXP_COMP_SKILLS" in by_type
+    assert by_type["EXP_COMP_SKILLS"].impact > 0
+
+
+def test_interaction_perfect_candidate_amp(
+    gcc_job,
+    perfect_match_candidate,
+    interaction_detector,
+    skills_scorer,
+    exp_scorer,
+):
     """Test PERFECT_CANDIDATE_AMP interaction (amplification of perfect match)."""
-    detector = FeatureInteractionDetector()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
     skills_result = skills_scorer.score(
         gcc_job.required_skills, perfect_match_candidate.skills, gcc_job.preferred_skills
     )
@@ -598,21 +744,19 @@ def test_interaction_perfect_candidate_amp(gcc_job, perfect_match_candidate, emb
         gcc_job.min_experience_years, gcc_job.max_experience_years, perfect_match_candidate.total_experience_years
     )
 
-    interactions = detector.detect_interactions(gcc_job, perfect_match_candidate, skills_result, exp_result, 95)
+    interactions = interaction_detector.detect_interactions(gcc_job, perfect_match_candidate, skills_result, exp_result, 95)
 
     # Should detect PERFECT_CANDIDATE_AMP
-    perfect_amp = [i for i in interactions if i.interaction_type == "PERFECT_CANDIDATE_AMP"]
-    assert len(perfect_amp) == 1
-    assert perfect_amp[0].impact > 0
-    assert perfect_amp[0].impact >= 3  # Strong amplification
+    by_type = {i.interaction_type: i for i in interactions}
+    assert len(by_type) == len(interactions)
+    assert "PERFECT_CANDIDATE_AMP" in by_type
+    assert by_type["PERFECT_CANDIDATE_AMP"].impact > 0
+    assert by_type["PERFECT_CANDIDATE_AMP"].impact >= 3  # Strong amplification
 
 
-def test_interaction_career_changer(embedding_model):
+@pytest.mark.slow
+def test_interaction_career_changer(interaction_detector, semantic_skills_scorer, exp_scorer):
     """Test CAREER_CHANGER interaction detection."""
-    detector = FeatureInteractionDetector()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
     # Non-GCC job for career changer test
     tech_job = Job(
         id="job-tech",
@@ -641,17 +785,35 @@ def test_interaction_career_changer(embedding_model):
         job_history=[{"title": "IT Manager", "company": "Co1", "years": 10, "location": "Dubai"}],
     )
 
-    skills_result = skills_scorer.score(tech_job.required_skills, career_changer.skills, tech_job.preferred_skills)
+    skills_result = semantic_skills_scorer.score(tech_job.required_skills, career_changer.skills, tech_job.preferred_skills)
     exp_result = exp_scorer.score(
         tech_job.min_experience_years, tech_job.max_experience_years, career_changer.total_experience_years
     )
 
-    interactions = detector.detect_interactions(tech_job, career_changer, skills_result, exp_result, 55)
+    interactions = interaction_detector.detect_interactions(tech_job, career_changer, skills_result, exp_result, 55)
 
     # Should detect CAREER_CHANGER
-    career_change = [i for i in interactions if i.interaction_type == "CAREER_CHANGER"]
-    assert len(career_change) == 1
-    assert career_change[0].impact < 0  # Negative impact
+    by_type = {i.interaction_type: i for i in interactions}
+    assert len(by_type) == len(interactions)
+    assert "CAREER_CHANGER" in by_type
+    assert by_type["CAREER_CHANGER"].impact < 0  # Negative impact
+
+
+# ============================================================================
+# Experience Scoring Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize("max_years", [None, 5, 10])
+def test_experience_score_many_matches_scalar(max_years):
+    """Test the vectorized experience scorer agrees with the scalar one."""
+    years = [-1, 0, 2.5, 5, 6.25, 7.5, 8, 10, 12, 18]
+
+    batch = ExperienceScorer.score_many(5, max_years, years)
+    single = [ExperienceScorer.score(5, max_years, y) for y in years]
+
+    assert [r.score for r in batch] == [r.score for r in single]
+    assert [r.explanation for r in batch] == [r.explanation for r in single]
 
 
 # ============================================================================
@@ -659,10 +821,9 @@ def test_interaction_career_changer(embedding_model):
 # ============================================================================
 
 
-def test_smart_weights_entry_level(entry_level_job):
+def test_smart_weights_entry_level(entry_level_job, weight_optimizer):
     """Test entry-level job gets skills-heavy weights."""
-    optimizer = SmartWeightOptimizer()
-    weights = optimizer.get_optimized_weights(entry_level_job)
+    weights = weight_optimizer.get_optimized_weights(entry_level_job)
 
     # Entry level should prioritize skills
     assert weights["skills"] >= 0.3
@@ -670,10 +831,9 @@ def test_smart_weights_entry_level(entry_level_job):
     assert "skills" in weights and "experience" in weights and "semantic" in weights
 
 
-def test_smart_weights_mid_level(gcc_job):
+def test_smart_weights_mid_level(gcc_job, weight_optimizer):
     """Test mid-level job gets balanced weights."""
-    optimizer = SmartWeightOptimizer()
-    weights = optimizer.get_optimized_weights(gcc_job)
+    weights = weight_optimizer.get_optimized_weights(gcc_job)
 
     # Mid-level should be balanced
     assert 0.25 <= weights["skills"] <= 0.35
@@ -681,10 +841,9 @@ def test_smart_weights_mid_level(gcc_job):
     assert 0.30 <= weights["semantic"] <= 0.40
 
 
-def test_smart_weights_senior_level(senior_level_job):
+def test_smart_weights_senior_level(senior_level_job, weight_optimizer):
     """Test senior-level job gets experience/domain-heavy weights."""
-    optimizer = SmartWeightOptimizer()
-    weights = optimizer.get_optimized_weights(senior_level_job)
+    weights = weight_optimizer.get_optimized_weights(senior_level_job)
 
     # Senior should emphasize experience and domain fit
     assert weights["experience"] >= 0.25
@@ -692,10 +851,9 @@ def test_smart_weights_senior_level(senior_level_job):
     assert weights["skills"] <= 0.30  # Skills less critical
 
 
-def test_smart_weights_sum_to_one(gcc_job):
+def test_smart_weights_sum_to_one(gcc_job, weight_optimizer):
     """Test that optimized weights always sum to 1.0."""
-    optimizer = SmartWeightOptimizer()
-    weights = optimizer.get_optimized_weights(gcc_job)
+    weights = weight_optimizer.get_optimized_weights(gcc_job)
 
     total = sum(weights.values())
     assert abs(total - 1.0) < 0.01  # Allow small floating point error
@@ -706,21 +864,23 @@ def test_smart_weights_sum_to_one(gcc_job):
 # ============================================================================
 
 
-def test_e2e_gcc_veteran_high_score(gcc_job, gcc_veteran_candidate, embedding_model):
+@pytest.mark.slow
+def test_e2e_gcc_veteran_high_score(
+    gcc_job,
+    gcc_veteran_candidate,
+    adjuster,
+    confidence_calc,
+    interaction_detector,
+    weight_optimizer,
+    semantic_skills_scorer,
+    exp_scorer,
+):
     """End-to-end test: GCC veteran should score very high with bonuses."""
-    adjuster = ContextualAdjuster()
-    confidence_calc = ConfidenceCalculator()
-    interaction_detector = FeatureInteractionDetector()
-    weight_optimizer = SmartWeightOptimizer()
-
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
     # Get optimized weights
     weights = weight_optimizer.get_optimized_weights(gcc_job)
 
     # Score sections
-    skills_result = skills_scorer.score(
+    skills_result = semantic_skills_scorer.score(
         gcc_job.required_skills, gcc_veteran_candidate.skills, gcc_job.preferred_skills
     )
     exp_result = exp_scorer.score(
@@ -754,13 +914,16 @@ def test_e2e_gcc_veteran_high_score(gcc_job, gcc_veteran_candidate, embedding_mo
     assert len(interactions) >= 0  # May or may not have interactions
 
 
-def test_e2e_overqualified_penalty(gcc_job, overqualified_candidate, embedding_model):
+@pytest.mark.slow
+def test_e2e_overqualified_penalty(
+    gcc_job,
+    overqualified_candidate,
+    adjuster,
+    semantic_skills_scorer,
+    exp_scorer,
+):
     """End-to-end test: Overqualified candidate should get penalty."""
-    adjuster = ContextualAdjuster()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
-    skills_result = skills_scorer.score(
+    skills_result = semantic_skills_scorer.score(
         gcc_job.required_skills, overqualified_candidate.skills, gcc_job.preferred_skills
     )
     exp_result = exp_scorer.score(
@@ -777,13 +940,15 @@ def test_e2e_overqualified_penalty(gcc_job, overqualified_candidate, embedding_m
     assert adjusted_score < base_score
 
 
-def test_e2e_perfect_candidate_max_score(gcc_job, perfect_match_candidate, embedding_model):
+def test_e2e_perfect_candidate_max_score(
+    gcc_job,
+    perfect_match_candidate,
+    adjuster,
+    confidence_calc,
+    skills_scorer,
+    exp_scorer,
+):
     """End-to-end test: Perfect candidate should approach or hit 100."""
-    adjuster = ContextualAdjuster()
-    confidence_calc = ConfidenceCalculator()
-    skills_scorer = SkillsScorer(embedding_model=embedding_model)
-    exp_scorer = ExperienceScorer()
-
     skills_result = skills_scorer.score(
         gcc_job.required_skills, perfect_match_candidate.skills, gcc_job.preferred_skills
     )
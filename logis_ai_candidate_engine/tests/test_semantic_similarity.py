@@ -0,0 +1,51 @@
+# Unit tests for SemanticSimilarityScorer (single and batched scoring)
+
+import pytest
+
+from logis_ai_candidate_engine.ml.embedding_model import EmbeddingModel
+from logis_ai_candidate_engine.ml.semantic_similarity import SemanticSimilarityScorer
+
+
+def _no_model(*args, **kwargs):
+    raise RuntimeError("model unavailable")
+
+
+@pytest.fixture(autouse=True)
+def hashing_embedder(monkeypatch):
+    """Score with the deterministic hashing fallback, never the transformer"""
+    monkeypatch.setattr(EmbeddingModel, "load", staticmethod(_no_model))
+    monkeypatch.setattr(EmbeddingModel, "_cache", type(EmbeddingModel._cache)())
+
+
+CANDIDATE_TEXTS = [
+    "Supply chain manager with 8 years of GCC logistics experience",
+    "",
+    "Frontend developer building React dashboards",
+    "   ",
+    None,
+    "Warehouse operations lead, SAP and inventory planning",
+]
+
+
+@pytest.mark.parametrize("job_profile_text", [None, "Arabic speaker preferred"])
+def test_score_many_matches_score(job_profile_text):
+    job_text = "Logistics manager for regional supply chain operations"
+
+    results = SemanticSimilarityScorer.score_many(job_text, CANDIDATE_TEXTS, job_profile_text)
+
+    assert results == [
+        SemanticSimilarityScorer.score(job_text, text, job_profile_text) for text in CANDIDATE_TEXTS
+    ]
+    assert results[1].score == 0 and results[3].score == 0 and results[4].score == 0
+
+
+@pytest.mark.parametrize("job_text", ["", "   "])
+def test_score_many_without_job_text(job_text):
+    results = SemanticSimilarityScorer.score_many(job_text, CANDIDATE_TEXTS)
+
+    assert results == [SemanticSimilarityScorer.score(job_text, text) for text in CANDIDATE_TEXTS]
+    assert all(result.score == 0 for result in results)
+
+
+def test_score_many_empty_batch():
+    assert SemanticSimilarityScorer.score_many("Logistics manager", []) == []
@@ -14,411 +14,202 @@ from logis_ai_candidate_engine.core.schemas.job import Job
 from logis_ai_candidate_engine.core.schemas.candidate import Candidate
 
 
+# One clock reading per run keeps visa-expiry cases consistent with each other
+_NOW = datetime.now()
+_VISA_FAR = (_NOW + timedelta(days=365)).date().isoformat()
+_VISA_SOON_45 = (_NOW + timedelta(days=45)).date().isoformat()
+_VISA_120 = (_NOW + timedelta(days=120)).date().isoformat()
+
+# Expected (lowercase) opening of each rule's rejection reason
+_REASON_KEYWORDS = {
+    "HR-001": "candidate does not have work authorization",
+    "HR-002": "candidate's visa expires within",
+    "HR-003": "candidate expected salary",
+    "HR-004": "candidate experience",
+    "HR-005": "candidate is overqualified",
+    "HR-006": "job requires specific nationality",
+    "HR-007": "candidate education",
+    "HR-008": "job requires prior gcc work experience",
+}
+
+
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
+_BASE_JOB_FIELDS = {
+    "job_id": "job-test-001",
+    "country": "UAE",
+    "title": "Software Engineer",
+    "industry": "Technology",
+    "functional_area": "Engineering",
+    "designation": "Engineer",
+    "min_experience_years": 3,
+    "max_experience_years": 8,
+    "salary_min": 10000,
+    "salary_max": 20000,
+    "currency": "AED",
+    "required_skills": ["python", "javascript"],
+    "job_description": "Software engineering role",
+}
+
+_BASE_CANDIDATE_FIELDS = {
+    "candidate_id": "cand-test-001",
+    "nationality": "Indian",
+    "current_country": "UAE",
+    "visa_status": "Work Visa",
+    "visa_expiry": _VISA_FAR,
+    "expected_salary": 15000,
+    "currency": "AED",
+    "total_experience_years": 5.0,
+    "gcc_experience_years": 2.0,
+    "skills": ["python", "javascript"],
+}
+
+
 def create_base_job(**overrides) -> Job:
     """Create a base job with all required fields"""
-    defaults = {
-        "job_id": "job-test-001",
-        "country": "UAE",
-        "title": "Software Engineer",
-        "industry": "Technology",
-        "functional_area": "Engineering",
-        "designation": "Engineer",
-        "min_experience_years": 3,
-        "max_experience_years": 8,
-        "salary_min": 10000,
-        "salary_max": 20000,
-        "currency": "AED",
-        "required_skills": ["python", "javascript"],
-        "job_description": "Software engineering role",
-    }
-    defaults.update(overrides)
-    return Job(**defaults)
+    return Job(**{**_BASE_JOB_FIELDS, **overrides})
 
 
 def create_base_candidate(**overrides) -> Candidate:
     """Create a base candidate with all required fields"""
-    defaults = {
-        "candidate_id": "cand-test-001",
-        "nationality": "Indian",
-        "current_country": "UAE",
-        "visa_status": "Work Visa",
-        "visa_expiry": (datetime.now() + timedelta(days=365)).date().isoformat(),
-        "expected_salary": 15000,
-        "currency": "AED",
-        "total_experience_years": 5.0,
-        "gcc_experience_years": 2.0,
-        "skills": ["python", "javascript"],
-    }
-    defaults.update(overrides)
-    return Candidate(**defaults)
-
-
-# ============================================================================
-# HR-001: Location + Visa Tests
-# ============================================================================
-
-def test_hr001_same_country_passes():
-    """Candidate in same country as job passes"""
-    job = create_base_job(country="UAE")
-    candidate = create_base_candidate(current_country="UAE")
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-001:PASSED" in result.rule_trace
+    return Candidate(**{**_BASE_CANDIDATE_FIELDS, **overrides})
 
 
-def test_hr001_different_country_with_work_visa_passes():
-    """Candidate in different country with work visa passes"""
-    job = create_base_job(country="UAE")
-    candidate = create_base_candidate(
-        current_country="India",
-        visa_status="Work Visa",
-    )
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-001:PASSED" in result.rule_trace
-
-
-def test_hr001_different_country_no_work_auth_fails():
-    """Candidate in different country without work authorization fails"""
-    job = create_base_job(country="UAE")
-    candidate = create_base_candidate(
-        current_country="India",
-        visa_status="Visit Visa",
-    )
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is False
-    assert result.rejection_rule_code == "HR-001"
-    assert "HR-001:FAILED" in result.rule_trace
-    assert "work authorization" in result.rejection_reason.lower()
+def _codes(trace) -> set:
+    """Rule codes that appear in a rule trace ("HR-001:PASSED" -> "HR-001")"""
+    return {entry.split(":", 1)[0] for entry in trace}
 
 
-def test_hr001_citizen_status_passes():
-    """Candidate with citizen status passes regardless of location"""
-    job = create_base_job(country="UAE")
-    candidate = create_base_candidate(
-        current_country="India",
-        visa_status="Citizen",
-    )
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-001:PASSED" in result.rule_trace
+def _assert_rule_outcome(result, code: str, eligible: bool) -> None:
+    """Check a single rule's pass/fail outcome, trace entry and rejection reason"""
+    if eligible:
+        assert result.is_eligible is True
+        assert f"{code}:PASSED" in result.rule_trace
+    else:
+        assert result.is_eligible is False
+        assert result.rejection_rule_code == code
+        assert f"{code}:FAILED" in result.rule_trace
+        assert result.rejection_reason.lower().startswith(_REASON_KEYWORDS[code])
 
 
 # ============================================================================
-# HR-002: Visa Expiry Tests
+# Rule Scenarios (HR-001 .. HR-008)
 # ============================================================================
 
-def test_hr002_visa_expires_soon_fails():
-    """Visa expiring within 90 days fails"""
-    job = create_base_job()
-    candidate = create_base_candidate(
-        visa_expiry=(datetime.now() + timedelta(days=45)).date().isoformat()
-    )
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is False
-    assert result.rejection_rule_code == "HR-002"
-    assert "HR-002:FAILED" in result.rule_trace
-
-
-def test_hr002_visa_expires_after_90_days_passes():
-    """Visa expiring after 90 days passes"""
-    job = create_base_job()
-    candidate = create_base_candidate(
-        visa_expiry=(datetime.now() + timedelta(days=120)).date().isoformat()
+# (job_update, candidate_update, eligible, rule code under test)
+SCENARIOS = [
+    # --- HR-001: Location + Visa ---
+    # Candidate in same country as job passes
+    pytest.param({"country": "UAE"}, {"current_country": "UAE"}, True, "HR-001",
+                 id="hr001_same_country_passes"),
+    # Candidate in different country with work visa passes
+    pytest.param({"country": "UAE"}, {"current_country": "India", "visa_status": "Work Visa"}, True, "HR-001",
+                 id="hr001_different_country_with_work_visa_passes"),
+    # Candidate in different country without work authorization fails
+    pytest.param({"country": "UAE"}, {"current_country": "India", "visa_status": "Visit Visa"}, False, "HR-001",
+                 id="hr001_different_country_no_work_auth_fails"),
+    # Candidate with citizen status passes regardless of location
+    pytest.param({"country": "UAE"}, {"current_country": "India", "visa_status": "Citizen"}, True, "HR-001",
+                 id="hr001_citizen_status_passes"),
+
+    # --- HR-002: Visa Expiry ---
+    # Visa expiring within 90 days fails
+    pytest.param({}, {"visa_expiry": _VISA_SOON_45}, False, "HR-002",
+                 id="hr002_visa_expires_soon_fails"),
+    # Visa expiring after 90 days passes
+    pytest.param({}, {"visa_expiry": _VISA_120}, True, "HR-002",
+                 id="hr002_visa_expires_after_90_days_passes"),
+    # Candidate without visa expiry date passes
+    pytest.param({}, {"visa_expiry": None}, True, "HR-002",
+                 id="hr002_no_visa_expiry_passes"),
+
+    # --- HR-003: Salary ---
+    # Salary within job range passes
+    pytest.param({"salary_max": 20000}, {"expected_salary": 15000}, True, "HR-003",
+                 id="hr003_salary_within_range_passes"),
+    # Salary exactly at max passes
+    pytest.param({"salary_max": 20000}, {"expected_salary": 20000}, True, "HR-003",
+                 id="hr003_salary_at_max_passes"),
+    # Salary within 10% tolerance passes (5% over)
+    pytest.param({"salary_max": 20000}, {"expected_salary": 21000}, True, "HR-003",
+                 id="hr003_salary_within_10_percent_tolerance_passes"),
+    # Salary exceeding 10% tolerance fails (15% over)
+    pytest.param({"salary_max": 20000}, {"expected_salary": 23000}, False, "HR-003",
+                 id="hr003_salary_exceeds_tolerance_fails"),
+
+    # --- HR-004: Minimum Experience ---
+    # Experience meeting minimum requirement passes
+    pytest.param({"min_experience_years": 3}, {"total_experience_years": 5.0}, True, "HR-004",
+                 id="hr004_experience_meets_minimum_passes"),
+    # Experience exactly at minimum passes
+    pytest.param({"min_experience_years": 3}, {"total_experience_years": 3.0}, True, "HR-004",
+                 id="hr004_experience_exactly_minimum_passes"),
+    # Experience below minimum fails
+    pytest.param({"min_experience_years": 5}, {"total_experience_years": 3.0}, False, "HR-004",
+                 id="hr004_experience_below_minimum_fails"),
+
+    # --- HR-005: Maximum Experience ---
+    # Experience within max range passes
+    pytest.param({"max_experience_years": 8}, {"total_experience_years": 6.0}, True, "HR-005",
+                 id="hr005_experience_within_max_passes"),
+    # Experience within 3-year tolerance passes (2 years over)
+    pytest.param({"max_experience_years": 8}, {"total_experience_years": 10.0}, True, "HR-005",
+                 id="hr005_experience_within_tolerance_passes"),
+    # Experience exceeding tolerance fails (7 years over)
+    pytest.param({"max_experience_years": 8}, {"total_experience_years": 15.0}, False, "HR-005",
+                 id="hr005_experience_exceeds_tolerance_fails"),
+    # No max experience requirement always passes
+    pytest.param({"max_experience_years": None}, {"total_experience_years": 20.0}, True, "HR-005",
+                 id="hr005_no_max_experience_passes"),
+
+    # --- HR-006: Nationality ---
+    # No nationality restriction passes all candidates
+    pytest.param({"preferred_nationality": []}, {"nationality": "Indian"}, True, "HR-006",
+                 id="hr006_no_nationality_restriction_passes"),
+    # Matching nationality passes
+    pytest.param({"preferred_nationality": ["Indian", "Pakistani"]}, {"nationality": "Indian"}, True, "HR-006",
+                 id="hr006_matching_nationality_passes"),
+    # Non-matching nationality fails
+    pytest.param({"preferred_nationality": ["UAE National"]}, {"nationality": "Indian"}, False, "HR-006",
+                 id="hr006_non_matching_nationality_fails"),
+
+    # --- HR-007: Education ---
+    # No education requirement passes
+    pytest.param({"required_education": None}, {"education_level": "High School"}, True, "HR-007",
+                 id="hr007_no_education_requirement_passes"),
+    # Exact education match passes
+    pytest.param({"required_education": "Bachelors"}, {"education_level": "Bachelors"}, True, "HR-007",
+                 id="hr007_exact_education_match_passes"),
+    # Higher education than required passes
+    pytest.param({"required_education": "Bachelors"}, {"education_level": "Masters"}, True, "HR-007",
+                 id="hr007_higher_education_passes"),
+    # Lower education than required fails
+    pytest.param({"required_education": "Masters"}, {"education_level": "Bachelors"}, False, "HR-007",
+                 id="hr007_lower_education_fails"),
+
+    # --- HR-008: GCC Experience ---
+    # GCC experience not required passes
+    pytest.param({"require_gcc_experience": False}, {"gcc_experience_years": 0}, True, "HR-008",
+                 id="hr008_gcc_not_required_passes"),
+    # GCC experience required and candidate has it passes
+    pytest.param({"require_gcc_experience": True}, {"gcc_experience_years": 2.0}, True, "HR-008",
+                 id="hr008_gcc_required_and_present_passes"),
+    # GCC experience required but candidate has none fails
+    pytest.param({"require_gcc_experience": True}, {"gcc_experience_years": 0}, False, "HR-008",
+                 id="hr008_gcc_required_but_missing_fails"),
+]
+
+
+@pytest.mark.parametrize("job_update,candidate_update,eligible,code", SCENARIOS)
+def test_rule(job_update, candidate_update, eligible, code):
+    """Each scenario passes or fails exactly the rule under test"""
+    result = HardRejectionEngine.evaluate(
+        create_base_job(**job_update), create_base_candidate(**candidate_update)
     )
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-002:PASSED" in result.rule_trace
-
-
-def test_hr002_no_visa_expiry_passes():
-    """Candidate without visa expiry date passes"""
-    job = create_base_job()
-    candidate = create_base_candidate(visa_expiry=None)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-002:PASSED" in result.rule_trace
-
-
-# ============================================================================
-# HR-003: Salary Tests
-# ============================================================================
-
-def test_hr003_salary_within_range_passes():
-    """Salary within job range passes"""
-    job = create_base_job(salary_max=20000)
-    candidate = create_base_candidate(expected_salary=15000)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-003:PASSED" in result.rule_trace
-
-
-def test_hr003_salary_at_max_passes():
-    """Salary exactly at max passes"""
-    job = create_base_job(salary_max=20000)
-    candidate = create_base_candidate(expected_salary=20000)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-003:PASSED" in result.rule_trace
 
-
-def test_hr003_salary_within_10_percent_tolerance_passes():
-    """Salary within 10% tolerance passes"""
-    job = create_base_job(salary_max=20000)
-    candidate = create_base_candidate(expected_salary=21000)  # 5% over
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-003:PASSED" in result.rule_trace
-
-
-def test_hr003_salary_exceeds_tolerance_fails():
-    """Salary exceeding 10% tolerance fails"""
-    job = create_base_job(salary_max=20000)
-    candidate = create_base_candidate(expected_salary=23000)  # 15% over
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is False
-    assert result.rejection_rule_code == "HR-003"
-    assert "HR-003:FAILED" in result.rule_trace
-
-
-# ============================================================================
-# HR-004: Minimum Experience Tests
-# ============================================================================
-
-def test_hr004_experience_meets_minimum_passes():
-    """Experience meeting minimum requirement passes"""
-    job = create_base_job(min_experience_years=3)
-    candidate = create_base_candidate(total_experience_years=5.0)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-004:PASSED" in result.rule_trace
-
-
-def test_hr004_experience_exactly_minimum_passes():
-    """Experience exactly at minimum passes"""
-    job = create_base_job(min_experience_years=3)
-    candidate = create_base_candidate(total_experience_years=3.0)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-004:PASSED" in result.rule_trace
-
-
-def test_hr004_experience_below_minimum_fails():
-    """Experience below minimum fails"""
-    job = create_base_job(min_experience_years=5)
-    candidate = create_base_candidate(total_experience_years=3.0)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is False
-    assert result.rejection_rule_code == "HR-004"
-    assert "HR-004:FAILED" in result.rule_trace
-
-
-# ============================================================================
-# HR-005: Maximum Experience Tests
-# ============================================================================
-
-def test_hr005_experience_within_max_passes():
-    """Experience within max range passes"""
-    job = create_base_job(max_experience_years=8)
-    candidate = create_base_candidate(total_experience_years=6.0)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-005:PASSED" in result.rule_trace
-
-
-def test_hr005_experience_within_tolerance_passes():
-    """Experience within 3-year tolerance passes"""
-    job = create_base_job(max_experience_years=8)
-    candidate = create_base_candidate(total_experience_years=10.0)  # 2 years over
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-005:PASSED" in result.rule_trace
-
-
-def test_hr005_experience_exceeds_tolerance_fails():
-    """Experience exceeding tolerance fails"""
-    job = create_base_job(max_experience_years=8)
-    candidate = create_base_candidate(total_experience_years=15.0)  # 7 years over
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is False
-    assert result.rejection_rule_code == "HR-005"
-    assert "HR-005:FAILED" in result.rule_trace
-    assert "overqualified" in result.rejection_reason.lower()
-
-
-def test_hr005_no_max_experience_passes():
-    """No max experience requirement always passes"""
-    job = create_base_job(max_experience_years=None)
-    candidate = create_base_candidate(total_experience_years=20.0)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-005:PASSED" in result.rule_trace
-
-
-# ============================================================================
-# HR-006: Nationality Tests
-# ============================================================================
-
-def test_hr006_no_nationality_restriction_passes():
-    """No nationality restriction passes all candidates"""
-    job = create_base_job(preferred_nationality=[])
-    candidate = create_base_candidate(nationality="Indian")
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-006:PASSED" in result.rule_trace
-
-
-def test_hr006_matching_nationality_passes():
-    """Matching nationality passes"""
-    job = create_base_job(preferred_nationality=["Indian", "Pakistani"])
-    candidate = create_base_candidate(nationality="Indian")
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-006:PASSED" in result.rule_trace
-
-
-def test_hr006_non_matching_nationality_fails():
-    """Non-matching nationality fails"""
-    job = create_base_job(preferred_nationality=["UAE National"])
-    candidate = create_base_candidate(nationality="Indian")
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is False
-    assert result.rejection_rule_code == "HR-006"
-    assert "HR-006:FAILED" in result.rule_trace
-
-
-# ============================================================================
-# HR-007: Education Tests
-# ============================================================================
-
-def test_hr007_no_education_requirement_passes():
-    """No education requirement passes"""
-    job = create_base_job(required_education=None)
-    candidate = create_base_candidate(education_level="High School")
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-007:PASSED" in result.rule_trace
-
-
-def test_hr007_exact_education_match_passes():
-    """Exact education match passes"""
-    job = create_base_job(required_education="Bachelors")
-    candidate = create_base_candidate(education_level="Bachelors")
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-007:PASSED" in result.rule_trace
-
-
-def test_hr007_higher_education_passes():
-    """Higher education than required passes"""
-    job = create_base_job(required_education="Bachelors")
-    candidate = create_base_candidate(education_level="Masters")
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-007:PASSED" in result.rule_trace
-
-
-def test_hr007_lower_education_fails():
-    """Lower education than required fails"""
-    job = create_base_job(required_education="Masters")
-    candidate = create_base_candidate(education_level="Bachelors")
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is False
-    assert result.rejection_rule_code == "HR-007"
-    assert "HR-007:FAILED" in result.rule_trace
-
-
-# ============================================================================
-# HR-008: GCC Experience Tests
-# ============================================================================
-
-def test_hr008_gcc_not_required_passes():
-    """GCC experience not required passes"""
-    job = create_base_job(require_gcc_experience=False)
-    candidate = create_base_candidate(gcc_experience_years=0)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-008:PASSED" in result.rule_trace
-
-
-def test_hr008_gcc_required_and_present_passes():
-    """GCC experience required and candidate has it passes"""
-    job = create_base_job(require_gcc_experience=True)
-    candidate = create_base_candidate(gcc_experience_years=2.0)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is True
-    assert "HR-008:PASSED" in result.rule_trace
-
-
-def test_hr008_gcc_required_but_missing_fails():
-    """GCC experience required but candidate has none fails"""
-    job = create_base_job(require_gcc_experience=True)
-    candidate = create_base_candidate(gcc_experience_years=0)
-    
-    result = HardRejectionEngine.evaluate(job, candidate)
-    
-    assert result.is_eligible is False
-    assert result.rejection_rule_code == "HR-008"
-    assert "HR-008:FAILED" in result.rule_trace
-    assert "GCC" in result.rejection_reason
+    _assert_rule_outcome(result, code, eligible)
 
 
 # ============================================================================
@@ -439,7 +230,7 @@ def test_all_rules_pass():
     candidate = create_base_candidate(
         current_country="UAE",
         visa_status="Work Visa",
-        visa_expiry=(datetime.now() + timedelta(days=365)).date().isoformat(),
+        visa_expiry=_VISA_FAR,
         expected_salary=15000,
         total_experience_years=5.0,
         gcc_experience_years=2.0,
@@ -450,19 +241,13 @@ def test_all_rules_pass():
     result = HardRejectionEngine.evaluate(job, candidate)
     
     assert result.is_eligible is True
-    assert "PASSED_ALL_HARD_RULES" in result.rule_trace
     assert result.rejection_reason is None
     assert result.rejection_rule_code is None
     
-    # Verify all 8 rules were checked
-    assert "HR-001:PASSED" in result.rule_trace
-    assert "HR-002:PASSED" in result.rule_trace
-    assert "HR-003:PASSED" in result.rule_trace
-    assert "HR-004:PASSED" in result.rule_trace
-    assert "HR-005:PASSED" in result.rule_trace
-    assert "HR-006:PASSED" in result.rule_trace
-    assert "HR-007:PASSED" in result.rule_trace
-    assert "HR-008:PASSED" in result.rule_trace
+    # Verify all 8 rules were checked and the final verdict recorded
+    trace = set(result.rule_trace)
+    expected = {f"HR-00{i}:PASSED" for i in range(1, 9)} | {"PASSED_ALL_HARD_RULES"}
+    assert expected <= trace, f"missing: {expected - trace}"
 
 
 def test_early_rejection_stops_evaluation():
@@ -470,7 +255,7 @@ def test_early_rejection_stops_evaluation():
     job = create_base_job(country="UAE")
     candidate = create_base_candidate(
         current_country="India",
-        visa_status="Visit Visa",  # Will fail HR-001
+        visa_status="Visit Visa",
     )
     
     result = HardRejectionEngine.evaluate(job, candidate)
@@ -480,8 +265,9 @@ def test_early_rejection_stops_evaluation():
     assert "HR-001:FAILED" in result.rule_trace
     
     # Subsequent rules should not be evaluated
-    assert "HR-002" not in " ".join(result.rule_trace)
-    assert "HR-003" not in " ".join(result.rule_trace)
+    codes = _codes(result.rule_trace)
+    assert "HR-002" not in codes
+    assert "HR-003" not in codes
 
 
 if __name__ == "__main__":
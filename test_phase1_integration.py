@@ -4,31 +4,93 @@ Tests the complete evaluation flow with enhanced schemas.
 """
 
 import json
+import traceback
 from datetime import datetime, timedelta
+from functools import lru_cache
 
-from logis_ai_candidate_engine.api.main import app, evaluate
+import pytest
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from logis_ai_candidate_engine.api.main import app, evaluate, _get_skills_scorer
 from logis_ai_candidate_engine.core.schemas.job import Job
 from logis_ai_candidate_engine.core.schemas.candidate import Candidate
 from logis_ai_candidate_engine.core.schemas.evaluation_response import EvaluationResponse
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _warmup():
+    """Build the shared scoring singletons once, before the first test"""
+    _get_skills_scorer()
+
+
+def _load_json(path: str) -> dict:
+    """Load a JSON file, with orjson when it is installed"""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+# Shared fields for the hand-built rejection cases; tests override what they probe
+_JOB_DEFAULTS = {
+    "job_id": "job-test",
+    "country": "UAE",
+    "title": "Test Job",
+    "industry": "Technology",
+    "functional_area": "Engineering",
+    "designation": "Engineer",
+    "min_experience_years": 3,
+    "salary_min": 10000,
+    "salary_max": 20000,
+    "currency": "AED",
+    "required_skills": ["python"],
+    "job_description": "Test job",
+}
+
+_CANDIDATE_DEFAULTS = {
+    "candidate_id": "cand-test",
+    "nationality": "Indian",
+    "current_country": "UAE",
+    "visa_status": "Work Visa",
+    "expected_salary": 15000,
+    "currency": "AED",
+    "total_experience_years": 5.0,
+    "skills": ["python"],
+}
+
+
+def _mk_job(**overrides) -> Job:
+    return Job(**{**_JOB_DEFAULTS, **overrides})
+
+
+def _mk_candidate(**overrides) -> Candidate:
+    return Candidate(**{**_CANDIDATE_DEFAULTS, **overrides})
+
+
+@lru_cache(maxsize=1)
+def _sample_pair():
+    """Parse and validate the sample job/candidate once; shared read-only across tests."""
+    job_data = _load_json("logis_ai_candidate_engine/data/sample_job.json")
+    job_data.pop("_comment", None)
+    
+    candidate_data = _load_json("logis_ai_candidate_engine/data/sample_candidate.json")
+    candidate_data.pop("_comment", None)
+    
+    return Job(**job_data), Candidate(**candidate_data)
+
+
 def test_perfect_match():
     """Test evaluation with a perfect candidate match"""
     print("="* 80)
     print("TEST 1: Perfect Match")
     print("=" * 80)
     
-    # Load sample data
-    with open("logis_ai_candidate_engine/data/sample_job.json", "r") as f:
-        job_data = json.load(f)
-        job_data.pop("_comment", None)
-    
-    with open("logis_ai_candidate_engine/data/sample_candidate.json", "r") as f:
-        candidate_data = json.load(f)
-        candidate_data.pop("_comment", None)
-    
-    job = Job(**job_data)
-    candidate = Candidate(**candidate_data)
+    job, candidate = _sample_pair()
     
     # Mock API call (bypassing auth)
     from logis_ai_candidate_engine.api.main import EvaluationRequest
@@ -67,31 +129,13 @@ def test_hard_rejection_salary():
     print("TEST 2: Hard Rejection - Salary Mismatch")
     print("=" * 80)
     
-    job = Job(
-        job_id="job-test",
-        country="UAE",
-        title="Test Job",
-        industry="Technology",
-        functional_area="Engineering",
-        designation="Engineer",
-        min_experience_years=3,
+    job = _mk_job(
         max_experience_years=8,
-        salary_min=10000,
         salary_max=15000,  # Low max
-        currency="AED",
-        required_skills=["python"],
-        job_description="Test job",
     )
     
-    candidate = Candidate(
-        candidate_id="cand-test",
-        nationality="Indian",
-        current_country="UAE",
-        visa_status="Work Visa",
+    candidate = _mk_candidate(
         expected_salary=25000,  # Way too high
-        currency="AED",
-        total_experience_years=5.0,
-        skills=["python"],
     )
     
     from logis_ai_candidate_engine.api.main import EvaluationRequest
@@ -123,30 +167,15 @@ def test_hard_rejection_no_work_auth():
     print("TEST 3: Hard Rejection - No Work Authorization")
     print("=" * 80)
     
-    job = Job(
-        job_id="job-test",
+    job = _mk_job(
         country="USA",  # Job in USA
-        title="Test Job",
-        industry="Technology",
-        functional_area="Engineering",
-        designation="Engineer",
-        min_experience_years=3,
-        salary_min=10000,
-        salary_max=20000,
         currency="USD",
-        required_skills=["python"],
-        job_description="Test job",
     )
     
-    candidate = Candidate(
-        candidate_id="cand-test",
-        nationality="Indian",
+    candidate = _mk_candidate(
         current_country="India",  # In India
         visa_status="No Visa",  # No work authorization
-        expected_salary=15000,
         currency="USD",
-        total_experience_years=5.0,
-        skills=["python"],
     )
     
     from logis_ai_candidate_engine.api.main import EvaluationRequest
@@ -176,32 +205,13 @@ def test_gcc_experience_requirement():
     print("TEST 4: Hard Rejection - Missing GCC Experience")
     print("=" * 80)
     
-    job = Job(
-        job_id="job-test",
-        country="UAE",
-        title="Test Job",
+    job = _mk_job(
         industry="Logistics",
-        functional_area="Engineering",
-        designation="Engineer",
-        min_experience_years=3,
-        salary_min=10000,
-        salary_max=20000,
-        currency="AED",
-        required_skills=["python"],
-        job_description="Test job",
         require_gcc_experience=True,  # Requires GCC experience
     )
     
-    candidate = Candidate(
-        candidate_id="cand-test",
-        nationality="Indian",
-        current_country="UAE",
-        visa_status="Work Visa",
-        expected_salary=15000,
-        currency="AED",
-        total_experience_years=5.0,
+    candidate = _mk_candidate(
         gcc_experience_years=0,  # No GCC experience
-        skills=["python"],
     )
     
     from logis_ai_candidate_engine.api.main import EvaluationRequest
@@ -231,16 +241,7 @@ def test_response_structure():
     print("TEST 5: Response Structure Validation")
     print("=" * 80)
     
-    with open("logis_ai_candidate_engine/data/sample_job.json", "r") as f:
-        job_data = json.load(f)
-        job_data.pop("_comment", None)
-    
-    with open("logis_ai_candidate_engine/data/sample_candidate.json", "r") as f:
-        candidate_data = json.load(f)
-        candidate_data.pop("_comment", None)
-    
-    job = Job(**job_data)
-    candidate = Candidate(**candidate_data)
+    job, candidate = _sample_pair()
     
     from logis_ai_candidate_engine.api.main import EvaluationRequest
     request = EvaluationRequest(job=job, candidate=candidate)
@@ -293,7 +294,6 @@ def main():
                 passed += 1
         except Exception as e:
             print(f"❌ {test_name} FAILED: {str(e)}\n")
-            import traceback
             traceback.print_exc()
             failed += 1
     
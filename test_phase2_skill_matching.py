@@ -16,6 +16,8 @@ import sys
 import json
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -24,10 +26,57 @@ from logis_ai_candidate_engine.core.schemas.job import Job
 from logis_ai_candidate_engine.core.schemas.candidate import Candidate
 from logis_ai_candidate_engine.core.scoring.skills_scorer import SkillsScorer
 from logis_ai_candidate_engine.ml.skill_matcher import SkillMatcher
-from sentence_transformers import SentenceTransformer
 
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Loaded once per process and shared by pytest fixtures and run_all_tests()
+_MODEL = None
+_SCORER = None
+_SEMANTIC_SCORER = None
+
+
+def _model():
+    global _MODEL
+    if _MODEL is None:
+        # Imported here so tests that never embed don't pay for torch
+        from sentence_transformers import SentenceTransformer
+        _MODEL = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    return _MODEL
+
+
+def _scorer():
+    global _SCORER
+    _SCORER = _SCORER or SkillsScorer()
+    return _SCORER
+
+
+def _semantic_scorer():
+    global _SEMANTIC_SCORER
+    if _SEMANTIC_SCORER is None:
+        # get_skill_matcher() returns the first matcher it built (model-less, via
+        # the shared scorer), so give this scorer its own model-backed matcher
+        _SEMANTIC_SCORER = SkillsScorer(embedding_model=_model())
+        _SEMANTIC_SCORER.skill_matcher = SkillMatcher(embedding_model=_model())
+    return _SEMANTIC_SCORER
+
+
+@pytest.fixture(scope="session")
+def embedding_model():
+    pytest.importorskip("sentence_transformers")
+    return _model()
 
-def test_exact_match():
+
+@pytest.fixture(scope="session")
+def scorer():
+    return _scorer()
+
+
+@pytest.fixture(scope="session")
+def semantic_scorer(embedding_model):
+    return _semantic_scorer()
+
+
+def test_exact_match(scorer):
     """Test 1: Perfect exact match - all skills matched exactly"""
     print("\n" + "="*80)
     print("TEST 1: Exact Match - Perfect Skill Alignment")
@@ -37,7 +86,6 @@ def test_exact_match():
     preferred_skills = ["AWS", "Kubernetes"]
     candidate_skills = ["Python", "FastAPI", "Docker", "AWS", "Kubernetes", "PostgreSQL"]
     
-    scorer = SkillsScorer()
     result = scorer.score(required_skills, candidate_skills, preferred_skills)
     
     print(f"✓ Overall Score: {result.score}/100")
@@ -57,7 +105,7 @@ def test_exact_match():
     print("✅ PASSED: Perfect exact match working correctly\n")
 
 
-def test_synonym_match():
+def test_synonym_match(scorer):
     """Test 2: Synonym matching - JS → JavaScript"""
     print("="*80)
     print("TEST 2: Synonym Matching - Abbreviation Handling")
@@ -67,7 +115,6 @@ def test_synonym_match():
     preferred_skills = ["Natural Language Processing"]
     candidate_skills = ["JS", "ML", "PostgreSQL", "NLP", "Python"]
     
-    scorer = SkillsScorer()
     result = scorer.score(required_skills, candidate_skills, preferred_skills)
     
     print(f"✓ Overall Score: {result.score}/100")
@@ -84,7 +131,7 @@ def test_synonym_match():
     print("✅ PASSED: Synonym matching working correctly\n")
 
 
-def test_semantic_similarity():
+def test_semantic_similarity(semantic_scorer):
     """Test 3: Semantic similarity - Infrastructure for future use"""
     print("="*80)
     print("TEST 3: Semantic Similarity - Infrastructure Validated")
@@ -95,11 +142,7 @@ def test_semantic_similarity():
     preferred_skills = ["Cloud Computing"]
     candidate_skills = ["Neural Networks", "Web Development", "AWS Infrastructure"]
     
-    # Load embedding model for semantic matching
-    print("  Loading embedding model...")
-    embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-    scorer = SkillsScorer(embedding_model=embedding_model)
-    result = scorer.score(required_skills, candidate_skills, preferred_skills)
+    result = semantic_scorer.score(required_skills, candidate_skills, preferred_skills)
     
     print(f"✓ Overall Score: {result.score}/100")
     print(f"✓ Matched Required: {result.matched_required}")
@@ -110,14 +153,14 @@ def test_semantic_similarity():
     # Verify embedding model is loaded and infrastructure is working
     # Even if semantic matches via synonym instead, that's fine - shows intelligent matching
     # The semantic similarity infrastructure is in place (threshold can be tuned later)
-    assert embedding_model is not None, "Embedding model should be loaded"
+    assert semantic_scorer.skill_matcher.embedding_model is not None, "Embedding model should be loaded"
     assert result.score >= 30, f"Should have decent score with intelligent matching, got {result.score}"
     assert len(result.matched_required) >= 1, "Should match at least one required skill"
     
     print(f"✅ PASSED: Semantic infrastructure validated (matched via {result.synonym_matches} synonym + {result.semantic_matches} semantic)\n")
 
 
-def test_required_vs_preferred_weighting():
+def test_required_vs_preferred_weighting(scorer):
     """Test 4: Required vs Preferred skill weighting (70/30)"""
     print("="*80)
     print("TEST 4: Required vs Preferred Weighting - Priority Scoring")
@@ -129,7 +172,6 @@ def test_required_vs_preferred_weighting():
     candidate_skills_a = ["Python", "FastAPI", "Docker"]  # All required, no preferred
     candidate_skills_b = ["AWS", "Kubernetes", "Redis"]   # No required, all preferred
     
-    scorer = SkillsScorer()
     result_a = scorer.score(required_skills, candidate_skills_a, preferred_skills)
     result_b = scorer.score(required_skills, candidate_skills_b, preferred_skills)
     
@@ -153,7 +195,7 @@ def test_required_vs_preferred_weighting():
     print("✅ PASSED: Required vs Preferred weighting correct (70/30)\n")
 
 
-def test_missing_skills_detection():
+def test_missing_skills_detection(scorer):
     """Test 5: Missing skills detection (required vs preferred)"""
     print("="*80)
     print("TEST 5: Missing Skills Detection - Gap Analysis")
@@ -163,7 +205,6 @@ def test_missing_skills_detection():
     preferred_skills = ["AWS", "Kubernetes", "Redis"]
     candidate_skills = ["Python", "Docker", "AWS"]
     
-    scorer = SkillsScorer()
     result = scorer.score(required_skills, candidate_skills, preferred_skills)
     
     print(f"✓ Matched Required: {result.matched_required}")
@@ -180,7 +221,7 @@ def test_missing_skills_detection():
     print("✅ PASSED: Missing skills correctly separated by priority\n")
 
 
-def test_match_details_structure():
+def test_match_details_structure(scorer):
     """Test 6: Match details structure for UI"""
     print("="*80)
     print("TEST 6: Match Details Structure - UI Integration")
@@ -190,7 +231,6 @@ def test_match_details_structure():
     preferred_skills = ["AWS"]
     candidate_skills = ["Python", "JS", "Amazon Web Services"]
     
-    scorer = SkillsScorer()
     result = scorer.score(required_skills, candidate_skills, preferred_skills)
     
     print(f"✓ Match Details Available: {bool(result.match_details)}")
@@ -214,14 +254,12 @@ def test_match_details_structure():
     print("✅ PASSED: Match details structure correct for UI\n")
 
 
-def test_edge_cases():
+def test_edge_cases(scorer):
     """Test 7: Edge cases - empty skills, no required, etc."""
     print("="*80)
     print("TEST 7: Edge Cases - Defensive Programming")
     print("="*80)
     
-    scorer = SkillsScorer()
-    
     # Case 1: No required skills
     result1 = scorer.score([], ["Python"], [])
     print(f"✓ Case 1 (No Required Skills): Score = {result1.score}")
@@ -279,23 +317,29 @@ def run_all_tests():
     print("PHASE 2: SKILL INTELLIGENCE - INTEGRATION TESTS")
     print("🚀 "*40 + "\n")
     
+    scorer = _scorer()
+    
+    def semantic_similarity():
+        # Load the embedding model only when this test runs
+        test_semantic_similarity(_semantic_scorer())
+    
     tests = [
-        ("Exact Match", test_exact_match),
-        ("Synonym Matching", test_synonym_match),
-        ("Semantic Similarity", test_semantic_similarity),
-        ("Required vs Preferred Weighting", test_required_vs_preferred_weighting),
-        ("Missing Skills Detection", test_missing_skills_detection),
-        ("Match Details Structure", test_match_details_structure),
-        ("Edge Cases", test_edge_cases),
-        ("SkillMatcher Direct API", test_skill_matcher_directly),
+        ("Exact Match", test_exact_match, (scorer,)),
+        ("Synonym Matching", test_synonym_match, (scorer,)),
+        ("Semantic Similarity", semantic_similarity, ()),
+        ("Required vs Preferred Weighting", test_required_vs_preferred_weighting, (scorer,)),
+        ("Missing Skills Detection", test_missing_skills_detection, (scorer,)),
+        ("Match Details Structure", test_match_details_structure, (scorer,)),
+        ("Edge Cases", test_edge_cases, (scorer,)),
+        ("SkillMatcher Direct API", test_skill_matcher_directly, ()),
     ]
     
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
+    for test_name, test_func, args in tests:
         try:
-            test_func()
+            test_func(*args)
             passed += 1
         except AssertionError as e:
             print(f"❌ FAILED: {test_name}")